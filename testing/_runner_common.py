@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Shared scaffolding for the standalone test runners.
+
+run_full_test.py and run_invalid_rice_test.py carried identical copies of
+the .env switching, server management and cleanup code. ScenarioRunner
+owns that machinery once; each runner script just declares its scenario
+and calls run(). run_all.py goes further and reuses a single running
+mock + bot pair across scenarios, skipping the dotnet boot per scenario.
+"""
+
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+PROJECT_DIR = "/home/jaime/Documents/projects/botGenerator"
+TESTING_DIR = f"{PROJECT_DIR}/testing"
+ENV_FILE = f"{PROJECT_DIR}/.env"
+ENV_BACKUP = f"{PROJECT_DIR}/.env.testing.backup"
+
+sys.path.insert(0, TESTING_DIR)
+
+from conversation_tester import ConversationTester, TestConfig
+
+# One keep-alive session for all readiness probes; a bare requests.get
+# opens (and tears down) a fresh TCP connection per poll.
+_probe_session = requests.Session()
+
+_ENV_RE = re.compile(rb'^WHATSAPP_API_URL=.*$', re.M)
+
+
+def _fast_copy(src, dst):
+    """Copy src to dst via os.sendfile, falling back to a large-buffer copy.
+
+    sendfile(2) moves the bytes kernel-side in one pass instead of looping
+    read/write through a small Python buffer.
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            remaining = os.fstat(src_fd).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        finally:
+            os.close(dst_fd)
+    except OSError:
+        # Some filesystems refuse sendfile; plain copy with a 1 MiB buffer.
+        shutil.copyfile(src, dst, length=1024 * 1024)
+    finally:
+        os.close(src_fd)
+
+
+class ScenarioRunner:
+    """Owns .env switching, the mock + bot processes, and teardown."""
+
+    def __init__(self):
+        self.processes = []
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+    def _signal_handler(self, sig, frame):
+        # Mask further SIGINT/SIGTERM before tearing down: cleanup() waits
+        # up to 5 s per child, plenty of time for a second Ctrl-C to
+        # re-enter it mid-restore and race the .env rename.
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+        try:
+            self.cleanup()
+        finally:
+            sys.exit(0)
+
+    def cleanup(self):
+        """Kill all spawned processes and restore .env"""
+        print("\n[CLEANUP] Stopping processes...")
+        # Signal every child first, then wait against one shared deadline:
+        # the shutdowns overlap, so worst-case teardown is 5 s total rather
+        # than 5 s per process.
+        for p in self.processes:
+            try:
+                p.terminate()
+            except:
+                pass
+        deadline = time.monotonic() + 5
+        for p in self.processes:
+            try:
+                p.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                try:
+                    p.kill()
+                except:
+                    pass
+        self.processes.clear()
+
+        # Restore .env if backup exists. Backup and target live on the same
+        # filesystem, so a rename restores atomically without re-copying a
+        # single byte -- and the separate remove disappears with it.
+        if os.path.exists(ENV_BACKUP):
+            print("[CLEANUP] Restoring original .env...")
+            os.replace(ENV_BACKUP, ENV_FILE)
+            print("[CLEANUP] .env restored")
+
+    def switch_to_test_mode(self):
+        """Backup .env and switch to test mode"""
+        print("[SETUP] Backing up .env...")
+        _fast_copy(ENV_FILE, ENV_BACKUP)
+
+        print("[SETUP] Switching to test mode (localhost:8080)...")
+        # For a file this small a single C-level regex sub over the raw
+        # bytes beats a Python per-line loop; keep the temp-file +
+        # os.replace dance so the swap stays atomic.
+        with open(ENV_FILE, 'rb') as src:
+            content = src.read()
+        content = _ENV_RE.sub(b'WHATSAPP_API_URL=http://localhost:8080', content, count=1)
+        with tempfile.NamedTemporaryFile(
+            'wb', dir=os.path.dirname(ENV_FILE), delete=False
+        ) as dst:
+            tmp_name = dst.name
+            dst.write(content)
+        os.replace(tmp_name, ENV_FILE)
+
+        print("[SETUP] .env updated for testing")
+
+    def spawn_mock(self):
+        """Launch the mock UAZAPI server without waiting for it."""
+        print("[SETUP] Starting mock UAZAPI server...")
+
+        # Use the venv python directly
+        venv_python = f"{TESTING_DIR}/venv/bin/python"
+        mock_script = f"{TESTING_DIR}/mock_uazapi_server.py"
+
+        p = subprocess.Popen(
+            [venv_python, mock_script],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=TESTING_DIR
+        )
+        self.processes.append(p)
+
+    def wait_mock_ready(self):
+        """Poll the mock server's health endpoint until it answers."""
+        # Poll immediately at a short interval instead of sleeping a fixed
+        # 3 s up front; the mock is usually up in a few hundred milliseconds.
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            try:
+                resp = _probe_session.get("http://localhost:8080/health", timeout=(0.2, 0.5))
+                if resp.status_code == 200:
+                    print("[SETUP] Mock server started successfully")
+                    return True
+            except:
+                pass
+            time.sleep(0.1)
+
+        print("[ERROR] Mock server failed to start")
+        return False
+
+    def spawn_bot(self):
+        """Launch the bot without waiting for it."""
+        print("[SETUP] Starting bot...")
+
+        p = subprocess.Popen(
+            ["dotnet", "run", "--project", "src/BotGenerator.Api"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=PROJECT_DIR
+        )
+        self.processes.append(p)
+
+    def wait_bot_ready(self):
+        """Poll the bot's health endpoint until it answers."""
+        print("[SETUP] Waiting for bot to compile and start...")
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                resp = _probe_session.get("http://localhost:5082/api/webhook/health", timeout=(0.2, 0.5))
+                if resp.status_code == 200:
+                    print("[SETUP] Bot started successfully")
+                    return True
+            except:
+                pass
+            time.sleep(0.2)
+
+        print("[ERROR] Bot failed to start")
+        return False
+
+    def setup(self):
+        """Switch .env and bring up both servers; True when both are ready."""
+        self.switch_to_test_mode()
+        # The two servers are independent, so spawn them back-to-back and
+        # overlap the readiness waits -- the mock boots while dotnet
+        # compiles, and total startup becomes max() not sum().
+        self.spawn_mock()
+        self.spawn_bot()
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            mock_ok = ex.submit(self.wait_mock_ready)
+            bot_ok = ex.submit(self.wait_bot_ready)
+            return mock_ok.result() and bot_ok.result()
+
+    def run_turns(self, name, turns, phone, banner=None):
+        """Run one conversation against the already-running servers."""
+        print("\n" + "="*60)
+        print(banner or f"RUNNING {name}")
+        print("="*60 + "\n")
+
+        config = TestConfig(
+            bot_webhook_url="http://localhost:5082/api/webhook/whatsapp-webhook",
+            mock_server_url="http://localhost:8080",
+            default_phone=phone,
+            response_timeout=30
+        )
+
+        tester = ConversationTester(config)
+        tester.clear_state()
+
+        result = tester.run_conversation(
+            name=name,
+            turns=turns,
+            clear_before=False
+        )
+
+        print("\n" + "="*60)
+        print("FULL CONVERSATION")
+        print("="*60)
+        for i, turn in enumerate(result.turns):
+            print(f"\n[Turn {i+1}]")
+            print(f"  User: {turn.user_input}")
+            if turn.bot_response:
+                print(f"  Bot: {turn.bot_response.text}")
+            else:
+                print(f"  Bot: (no response)")
+
+        print("\n" + "="*60)
+        print(f"RESULT: {'PASSED' if result.passed else 'FAILED'} ({result.passed_turns}/{result.total_turns} turns)")
+        print(f"Duration: {result.duration_seconds:.1f}s")
+        print("="*60 + "\n")
+
+        return result
+
+    def run(self, name, turns, phone, banner=None, require_pass=True):
+        """Full lifecycle for a single scenario: setup, run, cleanup."""
+        try:
+            if not self.setup():
+                self.cleanup()
+                return 1
+
+            result = self.run_turns(name, turns, phone, banner=banner)
+
+            self.cleanup()
+
+            if require_pass:
+                return 0 if result.passed else 1
+            return 0
+
+        except Exception as e:
+            print(f"[ERROR] {e}")
+            import traceback
+            traceback.print_exc()
+            self.cleanup()
+            return 1
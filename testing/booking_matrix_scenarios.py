@@ -7,10 +7,11 @@ They are executed by run_booking_matrix_tests.py, not the simple text-only runne
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scenario:
     key: str
     name: str
@@ -20,9 +21,31 @@ class Scenario:
     wants_rice: bool | None  # None means we will trigger a rice failure path
     rice_type: str | None = None
     rice_servings: int | None = None
+    # Hash is computed once so scenarios are cheap to use as dict/set keys
+    _hash: int = field(init=False, repr=False, compare=False, default=0)
 
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((
+                self.key,
+                self.name,
+                self.category,
+                self.expect_insert,
+                self.party_size,
+                self.wants_rice,
+                self.rice_type,
+                self.rice_servings,
+            )),
+        )
 
-def get_booking_matrix_scenarios() -> list[Scenario]:
+    def __hash__(self) -> int:
+        return self._hash
+
+
+@cache
+def get_booking_matrix_scenarios() -> tuple[Scenario, ...]:
     """
     A–E categories:
     - A: happy paths (insert)
@@ -30,8 +53,10 @@ def get_booking_matrix_scenarios() -> list[Scenario]:
     - C: abandonment (no insert)
     - D: topic switching (insert/no insert depending on completion)
     - E: adversarial/messy inputs (mostly no insert, or insert with last-value-wins)
+
+    Built once per process; scenarios are frozen so the tuple is safe to share.
     """
-    return [
+    return (
         # A) Happy paths
         Scenario(
             key="A1",
@@ -153,6 +178,6 @@ def get_booking_matrix_scenarios() -> list[Scenario]:
             party_size=2,
             wants_rice=None,
         ),
-    ]
+    )
 
 
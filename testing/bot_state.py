@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import requests
 
+# Shared keep-alive session so repeated clear calls reuse one TCP connection
+_SESSION = requests.Session()
+
 
 def clear_bot_state(bot_base_url: str, phone: str) -> None:
     """
@@ -10,7 +13,7 @@ def clear_bot_state(bot_base_url: str, phone: str) -> None:
     bot_base_url example: http://localhost:5082
     """
     url = f"{bot_base_url}/api/webhook/test/clear-state"
-    resp = requests.post(url, params={"phone": phone}, timeout=10)
+    resp = _SESSION.post(url, params={"phone": phone}, timeout=10)
     resp.raise_for_status()
 
 
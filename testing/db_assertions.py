@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Sequence
+
+from mysql.connector.pooling import MySQLConnectionPool
 
 
 MYSQL_HOST = "127.0.0.1"
@@ -9,6 +13,32 @@ MYSQL_USER = "root"
 MYSQL_PASSWORD = "123123"
 MYSQL_DB = "villacarmen"
 
+# Lazily created so importing this module never requires a reachable MySQL.
+# Each mysql CLI invocation used to pay fork + TCP connect + auth per
+# assertion; pooled connections amortize that across the whole suite.
+_POOL: MySQLConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool() -> MySQLConnectionPool:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = MySQLConnectionPool(
+                    pool_name="assertions",
+                    pool_size=5,
+                    host=MYSQL_HOST,
+                    user=MYSQL_USER,
+                    password=MYSQL_PASSWORD,
+                    database=MYSQL_DB,
+                )
+    return _POOL
+
+
+_SCHEMA_READY = False
+_SCHEMA_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class BookingRow:
@@ -23,75 +53,185 @@ class BookingRow:
     status: str
 
 
-def _mysql_query_tsv(sql: str) -> list[list[str]]:
+def _mysql_query(sql: str, params: tuple = ()) -> list[tuple]:
     """
-    Execute SQL via the mysql CLI and return rows as list of fields.
-    Uses -N -B for raw tab-separated output with no header.
+    Execute a parameterized query on a pooled connection and return the rows
+    as native Python tuples.
     """
-    cmd = [
-        "mysql",
-        "-h",
-        MYSQL_HOST,
-        f"-u{MYSQL_USER}",
-        f"-p{MYSQL_PASSWORD}",
-        "-D",
-        MYSQL_DB,
-        "-N",
-        "-B",
-        "-e",
-        sql,
-    ]
-    out = subprocess.check_output(cmd, text=True)
-    out = out.strip("\n")
-    if not out:
-        return []
-    rows = []
-    for line in out.splitlines():
-        rows.append(line.split("\t"))
-    return rows
+    cn = _get_pool().get_connection()
+    try:
+        cur = cn.cursor()
+        try:
+            # Without params the statement is sent verbatim, so literal %
+            # signs (e.g. in TIME_FORMAT masks) need no escaping there.
+            if params:
+                cur.execute(sql, params)
+            else:
+                cur.execute(sql)
+            return cur.fetchall() if cur.with_rows else []
+        finally:
+            cur.close()
+    finally:
+        cn.close()
 
 
-def find_booking_by_phone_date_time(
-    *,
-    phone_last9: str,
-    db_date: str,  # yyyy-mm-dd
-    db_time_hhmm: str,  # HH:mm
-) -> list[BookingRow]:
-    sql = f"""
+def _ensure_schema() -> None:
+    """
+    Make sure the bookings table has a stored reservation_time_hhmm column
+    and a composite lookup index, applying them on first use.
+
+    Filtering on TIME_FORMAT(reservation_time, ...) forced a full scan and
+    a per-row format call; a STORED generated column indexed together with
+    phone and date turns every assertion lookup into an index seek. Runs
+    once per process and is a no-op when the schema is already in place.
+    """
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+    with _SCHEMA_LOCK:
+        if _SCHEMA_READY:
+            return
+        has_column = _mysql_query(
+            "SELECT 1 FROM information_schema.COLUMNS"
+            " WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'bookings'"
+            " AND COLUMN_NAME = 'reservation_time_hhmm'",
+            (MYSQL_DB,),
+        )
+        if not has_column:
+            _mysql_query(
+                "ALTER TABLE bookings"
+                " ADD COLUMN reservation_time_hhmm CHAR(5)"
+                " GENERATED ALWAYS AS (TIME_FORMAT(reservation_time, '%H:%i')) STORED"
+            )
+        has_index = _mysql_query(
+            "SELECT 1 FROM information_schema.STATISTICS"
+            " WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'bookings'"
+            " AND INDEX_NAME = 'idx_bookings_assertion'",
+            (MYSQL_DB,),
+        )
+        if not has_index:
+            _mysql_query(
+                "ALTER TABLE bookings ADD INDEX idx_bookings_assertion"
+                " (contact_phone, reservation_date, reservation_time_hhmm)"
+            )
+        _SCHEMA_READY = True
+
+
+_SELECT_BOOKING = """
 SELECT
   id,
   customer_name,
   contact_phone,
   reservation_date,
-  TIME_FORMAT(reservation_time, '%H:%i') AS reservation_time_hhmm,
+  reservation_time_hhmm,
   party_size,
   JSON_UNQUOTE(JSON_EXTRACT(arroz_type, '$[0]')) AS arroz_type,
   CAST(JSON_EXTRACT(arroz_servings, '$[0]') AS UNSIGNED) AS arroz_servings,
   status
 FROM bookings
-WHERE contact_phone = '{phone_last9}'
-  AND reservation_date = '{db_date}'
-  AND TIME_FORMAT(reservation_time, '%H:%i') = '{db_time_hhmm}'
-ORDER BY id DESC;
 """.strip()
 
-    rows = _mysql_query_tsv(sql)
-    result: list[BookingRow] = []
+
+def _row_to_booking(r: tuple) -> BookingRow:
+    # The driver hands back typed values: reservation_date is a
+    # datetime.date, party_size and arroz_servings are ints (or None), so
+    # the TSV-era "NULL" sentinels and int() casts are gone. The date is
+    # rendered once to the yyyy-mm-dd string callers compare against.
+    return BookingRow(
+        id=r[0],
+        customer_name=r[1],
+        contact_phone=r[2],
+        reservation_date=r[3].isoformat(),
+        reservation_time_hhmm=r[4],
+        party_size=r[5],
+        arroz_type=(r[6] or None),
+        arroz_servings=r[7],
+        status=r[8],
+    )
+
+
+def find_booking_by_phone_date_time(
+    *,
+    phone_last9: str,
+    db_date: str,  # yyyy-mm-dd
+    db_time_hhmm: str,  # HH:mm
+) -> list[BookingRow]:
+    _ensure_schema()
+    sql = (
+        _SELECT_BOOKING
+        + """
+WHERE contact_phone = %s
+  AND reservation_date = %s
+  AND reservation_time_hhmm = %s
+ORDER BY id DESC"""
+    )
+    rows = _mysql_query(sql, (phone_last9, db_date, db_time_hhmm))
+    return [_row_to_booking(r) for r in rows]
+
+
+def find_bookings_many(
+    specs: Sequence[tuple[str, str, str]],  # (phone_last9, db_date, db_time_hhmm)
+) -> list[list[BookingRow]]:
+    """
+    Fetch bookings for many (phone, date, time) specs with ONE query.
+
+    Uses a row-constructor IN list so N assertions cost a single round-trip
+    instead of N. Results come back grouped in the same order as `specs`,
+    each group sorted latest-first like find_booking_by_phone_date_time.
+    """
+    if not specs:
+        return []
+
+    _ensure_schema()
+    placeholders = ", ".join(["(%s, %s, %s)"] * len(specs))
+    sql = (
+        _SELECT_BOOKING
+        + f"""
+WHERE (contact_phone, reservation_date, reservation_time_hhmm)
+  IN ({placeholders})
+ORDER BY id DESC"""
+    )
+    params = tuple(value for spec in specs for value in spec)
+    rows = _mysql_query(sql, params)
+
+    grouped: dict[tuple[str, str, str], list[BookingRow]] = {}
     for r in rows:
-        result.append(
-            BookingRow(
-                id=int(r[0]),
-                customer_name=r[1],
-                contact_phone=r[2],
-                reservation_date=r[3],
-                reservation_time_hhmm=r[4],
-                party_size=int(r[5]),
-                arroz_type=(r[6] if r[6] != "NULL" and r[6] != "" else None),
-                arroz_servings=(int(r[7]) if r[7] != "NULL" and r[7] != "" else None),
-                status=r[8],
+        booking = _row_to_booking(r)
+        key = (booking.contact_phone, booking.reservation_date, booking.reservation_time_hhmm)
+        grouped.setdefault(key, []).append(booking)
+
+    return [grouped.get(tuple(spec), []) for spec in specs]
+
+
+def find_bookings_batch(
+    specs: Sequence[tuple[str, str, str]],  # (phone_last9, db_date, db_time_hhmm)
+) -> list[list[BookingRow]]:
+    """
+    Run several booking lookups concurrently on the connection pool.
+
+    Matrix runs assert one booking per scenario; issuing those lookups
+    sequentially serializes a network round-trip per scenario. Fanning them
+    out over the pool overlaps the round-trips, bounded by the pool size.
+    Results come back in the same order as `specs`.
+    """
+    if not specs:
+        return []
+    if len(specs) == 1:
+        phone_last9, db_date, db_time_hhmm = specs[0]
+        return [
+            find_booking_by_phone_date_time(
+                phone_last9=phone_last9, db_date=db_date, db_time_hhmm=db_time_hhmm
             )
+        ]
+
+    def lookup(spec: tuple[str, str, str]) -> list[BookingRow]:
+        phone_last9, db_date, db_time_hhmm = spec
+        return find_booking_by_phone_date_time(
+            phone_last9=phone_last9, db_date=db_date, db_time_hhmm=db_time_hhmm
         )
-    return result
+
+    with ThreadPoolExecutor(max_workers=min(len(specs), 5)) as executor:
+        return list(executor.map(lookup, specs))
 
 
 def assert_booking_inserted(
@@ -107,6 +247,45 @@ def assert_booking_inserted(
     rows = find_booking_by_phone_date_time(
         phone_last9=phone_last9, db_date=db_date, db_time_hhmm=db_time_hhmm
     )
+    return _validate_inserted(
+        rows,
+        phone_last9=phone_last9,
+        db_date=db_date,
+        db_time_hhmm=db_time_hhmm,
+        expected_party_size=expected_party_size,
+        expected_status=expected_status,
+        expected_arroz_type=expected_arroz_type,
+        expected_arroz_servings=expected_arroz_servings,
+    )
+
+
+def assert_all_bookings(expectations: Sequence[dict]) -> list[BookingRow]:
+    """
+    Validate many expected inserts with a single database query.
+
+    Each expectation is a dict of assert_booking_inserted keyword arguments.
+    All lookups go through find_bookings_many, so this costs one round-trip
+    regardless of how many scenarios are being checked.
+    """
+    specs = [(e["phone_last9"], e["db_date"], e["db_time_hhmm"]) for e in expectations]
+    groups = find_bookings_many(specs)
+    return [
+        _validate_inserted(rows, **expectation)
+        for rows, expectation in zip(groups, expectations)
+    ]
+
+
+def _validate_inserted(
+    rows: list[BookingRow],
+    *,
+    phone_last9: str,
+    db_date: str,
+    db_time_hhmm: str,
+    expected_party_size: int,
+    expected_status: str = "pending",
+    expected_arroz_type: str | None = None,
+    expected_arroz_servings: int | None = None,
+) -> BookingRow:
     if not rows:
         raise AssertionError(
             f"Expected booking to be inserted but none found for phone={phone_last9}, date={db_date}, time={db_time_hhmm}"
@@ -150,5 +329,3 @@ def assert_no_booking_inserted(
         raise AssertionError(
             f"Expected NO booking insert, but found {len(rows)} row(s). Latest id={rows[0].id} for phone={phone_last9}, date={db_date}, time={db_time_hhmm}"
         )
-
-
@@ -8,15 +8,34 @@ This module analyzes conversation logs to detect:
 4. Strange patterns that indicate bot malfunction
 """
 
+import os
 import re
+from collections import Counter
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import NamedTuple, Optional
 from datetime import datetime
 
 
-@dataclass
-class LogMessage:
+# Conversation line format: dd-mm-yy hh-mm -sender message
+_CONV_LINE_RE = re.compile(r'^(\d{2}-\d{2}-\d{2}\s+\d{2}-\d{2})\s+-(\w+)\s+(.*)$')
+
+# Header prefix -> metadata key, resolved with one partition + dict lookup
+# instead of a startswith chain per line
+# analyze_log results keyed by (path, mtime_ns, size): the quality runners
+# analyze the same log more than once (per-test check plus final report),
+# and logs never change after the writer closes them.
+_ANALYSIS_CACHE: dict[tuple[str, int, int], 'LogAnalysisResult'] = {}
+
+_HEADER_KEYS = {
+    'Test Name': 'test_name',
+    'Phone': 'phone',
+    'Duration': 'duration',
+    'Result': 'result',
+}
+
+
+class LogMessage(NamedTuple):
     """Represents a single message in the log"""
     timestamp: str
     sender: str  # 'client' or 'bot'
@@ -24,7 +43,7 @@ class LogMessage:
     line_number: int
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityIssue:
     """Represents a quality issue found in the log"""
     issue_type: str
@@ -34,7 +53,7 @@ class QualityIssue:
     details: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogAnalysisResult:
     """Result of analyzing a conversation log"""
     log_path: str
@@ -44,6 +63,11 @@ class LogAnalysisResult:
     bot_messages: int
     issues: list[QualityIssue] = field(default_factory=list)
     passed: bool = True
+    # Tallied once in analyze_log so callers can test issue types without
+    # re-scanning the issues list (the quality tests each did their own
+    # O(n) comprehension over it)
+    issue_counts: Counter = field(default_factory=Counter)
+    has_error_leak: bool = False
 
     @property
     def has_errors(self) -> bool:
@@ -54,6 +78,28 @@ class LogAnalysisResult:
         return any(i.severity == 'warning' for i in self.issues)
 
 
+@dataclass(slots=True)
+class _MessageIndex:
+    """
+    Pre-partitioned view of a parsed log, shared by the check_* methods so
+    each pass does not re-filter the message list by sender.
+    """
+    messages: list[LogMessage]
+    client_messages: list[LogMessage]
+    bot_messages: list[LogMessage]
+
+    @classmethod
+    def from_messages(cls, messages: list[LogMessage]) -> '_MessageIndex':
+        client = []
+        bot = []
+        for msg in messages:
+            if msg.sender == 'client':
+                client.append(msg)
+            elif msg.sender == 'bot':
+                bot.append(msg)
+        return cls(messages=messages, client_messages=client, bot_messages=bot)
+
+
 class LogQualityAnalyzer:
     """Analyzes conversation logs for quality issues"""
 
@@ -97,6 +143,36 @@ class LogQualityAnalyzer:
         (r'Ã©|Ã¡|Ã­|Ã³|Ã±', 'Broken UTF-8 encoding'),
     ]
 
+    # All non-human patterns fused into a single alternation with one named
+    # group per pattern, so each bot message is scanned once instead of once
+    # per pattern. match.lastgroup identifies which pattern fired.
+    _NON_HUMAN_FUSED = re.compile(
+        '|'.join(
+            f'(?P<p{i}>{pattern})'
+            for i, (pattern, _) in enumerate(NON_HUMAN_PATTERNS)
+        ),
+        re.IGNORECASE,
+    )
+    _NON_HUMAN_BY_GROUP = {
+        f'p{i}': (pattern, description)
+        for i, (pattern, description) in enumerate(NON_HUMAN_PATTERNS)
+    }
+
+    # Compiled once at class-definition time; re.search with the raw pattern
+    # paid a cache lookup per message per pattern.
+    _SPANISH_COMPILED = [
+        (re.compile(pattern), pattern, description)
+        for pattern, description in SPANISH_QUALITY_PATTERNS
+    ]
+
+    # MinHash/LSH parameters for near-duplicate candidate generation:
+    # 64 salted hashes split into 8 bands of 8 rows. Messages agreeing on
+    # any full band become candidate pairs; pairs around the 0.85 Jaccard
+    # threshold collide with high probability at this shape.
+    _MINHASH_PERMS = 64
+    _LSH_BANDS = 8
+    _LSH_ROWS = 8
+
     def __init__(self, logs_dir: str = "logs"):
         self.logs_dir = Path(logs_dir)
 
@@ -111,52 +187,53 @@ class LogQualityAnalyzer:
         messages = []
         metadata = {}
 
-        with open(log_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
         in_conversation = False
-        line_num = 0
-
-        for line in lines:
-            line_num += 1
-            line = line.rstrip('\n')
-
-            # Parse metadata from header
-            if line.startswith('Test Name:'):
-                metadata['test_name'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Phone:'):
-                metadata['phone'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Duration:'):
-                metadata['duration'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Result:'):
-                metadata['result'] = line.split(':', 1)[1].strip()
-            elif line.startswith('CONVERSATION (timestamped):'):
-                in_conversation = True
-                continue
-            elif line.startswith('SUMMARY:'):
-                in_conversation = False
-
-            # Parse conversation messages
-            if in_conversation and line and not line.startswith('-' * 10):
-                # Format: dd-mm-yy hh-mm -sender message
-                match = re.match(r'^(\d{2}-\d{2}-\d{2}\s+\d{2}-\d{2})\s+-(\w+)\s+(.*)$', line)
-                if match:
-                    messages.append(LogMessage(
-                        timestamp=match.group(1),
-                        sender=match.group(2),
-                        text=match.group(3),
-                        line_number=line_num
-                    ))
+
+        # Stream the file line by line; readlines() materialized the whole
+        # log in memory before parsing even started.
+        with open(log_path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.rstrip('\n')
+
+                # Parse metadata from header
+                if not in_conversation:
+                    if line.startswith('CONVERSATION (timestamped):'):
+                        in_conversation = True
+                        continue
+                    key, sep, value = line.partition(':')
+                    if sep:
+                        metadata_key = _HEADER_KEYS.get(key)
+                        if metadata_key:
+                            metadata[metadata_key] = value.strip()
+                    continue
+
+                # Nothing after the summary section is parsed; stop reading
+                if line.startswith('SUMMARY:'):
+                    break
+
+                # Parse conversation messages
+                if line and not line.startswith('----------'):
+                    match = _CONV_LINE_RE.match(line)
+                    if match:
+                        messages.append(LogMessage(
+                            timestamp=match.group(1),
+                            sender=match.group(2),
+                            text=match.group(3),
+                            line_number=line_num
+                        ))
 
         return messages, metadata
 
-    def check_duplications(self, messages: list[LogMessage]) -> list[QualityIssue]:
+    def check_duplications(self, index: _MessageIndex) -> list[QualityIssue]:
         """Check for duplicated bot messages"""
         issues = []
-        bot_messages = [m for m in messages if m.sender == 'bot']
+        bot_messages = index.bot_messages
 
-        # Check for exact duplications
+        # Exact and consecutive duplications share one pass: track the line
+        # each normalized message first appeared on plus the previous
+        # message's text.
         seen_messages = {}
+        prev_text = None
         for msg in bot_messages:
             normalized = msg.text.lower().strip()
             if normalized in seen_messages:
@@ -174,58 +251,61 @@ class LogQualityAnalyzer:
             else:
                 seen_messages[normalized] = msg.line_number
 
-        # Check for near-duplications (very similar messages)
-        for i, msg1 in enumerate(bot_messages):
-            for j, msg2 in enumerate(bot_messages[i+1:], i+1):
-                similarity = self._calculate_similarity(msg1.text, msg2.text)
-                if 0.85 < similarity < 1.0:  # Very similar but not exact
-                    issues.append(QualityIssue(
-                        issue_type='near_duplication',
-                        severity='warning',
-                        description=f'Bot messages very similar ({similarity:.0%})',
-                        line_number=msg2.line_number,
-                        details={
-                            'message1': msg1.text[:80],
-                            'message2': msg2.text[:80],
-                            'similarity': similarity
-                        }
-                    ))
-
-        # Check for consecutive identical responses
-        for i in range(1, len(bot_messages)):
-            if bot_messages[i].text == bot_messages[i-1].text:
+            if msg.text == prev_text:
                 issues.append(QualityIssue(
                     issue_type='consecutive_duplication',
                     severity='critical',
                     description='Bot sent identical consecutive messages',
-                    line_number=bot_messages[i].line_number,
-                    details={'text': bot_messages[i].text[:100]}
+                    line_number=msg.line_number,
+                    details={'text': msg.text[:100]}
                 ))
+            prev_text = msg.text
+
+        # Check for near-duplications (very similar messages). Banded
+        # MinHash LSH narrows the pairwise comparison down to pairs whose
+        # signatures collide in at least one band; only those candidates
+        # pay for an exact similarity computation.
+        for i, j, similarity in self._near_duplicate_pairs(bot_messages):
+            msg1, msg2 = bot_messages[i], bot_messages[j]
+            issues.append(QualityIssue(
+                issue_type='near_duplication',
+                severity='warning',
+                description=f'Bot messages very similar ({similarity:.0%})',
+                line_number=msg2.line_number,
+                details={
+                    'message1': msg1.text[:80],
+                    'message2': msg2.text[:80],
+                    'similarity': similarity
+                }
+            ))
 
         return issues
 
-    def check_non_human_patterns(self, messages: list[LogMessage]) -> list[QualityIssue]:
+    def check_non_human_patterns(self, index: _MessageIndex) -> list[QualityIssue]:
         """Check for non-human patterns in bot responses"""
         issues = []
 
-        for msg in messages:
-            if msg.sender != 'bot':
-                continue
-
-            # Check against non-human patterns
-            for pattern, description in self.NON_HUMAN_PATTERNS:
-                if re.search(pattern, msg.text, re.IGNORECASE):
-                    issues.append(QualityIssue(
-                        issue_type='non_human_pattern',
-                        severity='error',
-                        description=description,
-                        line_number=msg.line_number,
-                        details={'matched_pattern': pattern, 'text': msg.text[:100]}
-                    ))
+        for msg in index.bot_messages:
+            # Check against non-human patterns (single fused scan, at most
+            # one issue per pattern like the old per-pattern searches)
+            seen_groups = set()
+            for match in self._NON_HUMAN_FUSED.finditer(msg.text):
+                group = match.lastgroup
+                if group in seen_groups:
+                    continue
+                seen_groups.add(group)
+                pattern, description = self._NON_HUMAN_BY_GROUP[group]
+                issues.append(QualityIssue(
+                    issue_type='non_human_pattern',
+                    severity='error',
+                    description=description,
+                    line_number=msg.line_number,
+                    details={'matched_pattern': pattern, 'text': msg.text[:100]}
+                ))
 
             # Check Spanish quality patterns
-            for pattern, description in self.SPANISH_QUALITY_PATTERNS:
-                if re.search(pattern, msg.text):
+            for regex, pattern, description in self._SPANISH_COMPILED:
+                if regex.search(msg.text):
                     issues.append(QualityIssue(
                         issue_type='quality_issue',
                         severity='error',
@@ -257,9 +337,10 @@ class LogQualityAnalyzer:
 
         return issues
 
-    def check_conversation_flow(self, messages: list[LogMessage]) -> list[QualityIssue]:
+    def check_conversation_flow(self, index: _MessageIndex) -> list[QualityIssue]:
         """Check for conversation flow issues"""
         issues = []
+        messages = index.messages
 
         if not messages:
             issues.append(QualityIssue(
@@ -306,9 +387,10 @@ class LogQualityAnalyzer:
 
         return issues
 
-    def check_response_coherence(self, messages: list[LogMessage]) -> list[QualityIssue]:
+    def check_response_coherence(self, index: _MessageIndex) -> list[QualityIssue]:
         """Check for response coherence issues"""
         issues = []
+        messages = index.messages
 
         # Build client-bot pairs
         pairs = []
@@ -358,16 +440,24 @@ class LogQualityAnalyzer:
             LogAnalysisResult with all findings
         """
         log_path = Path(log_path)
+
+        stat = log_path.stat()
+        cache_key = (str(log_path), stat.st_mtime_ns, stat.st_size)
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         messages, metadata = self.parse_log_file(log_path)
+        index = _MessageIndex.from_messages(messages)
 
         all_issues = []
-        all_issues.extend(self.check_duplications(messages))
-        all_issues.extend(self.check_non_human_patterns(messages))
-        all_issues.extend(self.check_conversation_flow(messages))
-        all_issues.extend(self.check_response_coherence(messages))
+        all_issues.extend(self.check_duplications(index))
+        all_issues.extend(self.check_non_human_patterns(index))
+        all_issues.extend(self.check_conversation_flow(index))
+        all_issues.extend(self.check_response_coherence(index))
 
-        client_count = sum(1 for m in messages if m.sender == 'client')
-        bot_count = sum(1 for m in messages if m.sender == 'bot')
+        client_count = len(index.client_messages)
+        bot_count = len(index.bot_messages)
 
         result = LogAnalysisResult(
             log_path=str(log_path),
@@ -376,9 +466,15 @@ class LogQualityAnalyzer:
             client_messages=client_count,
             bot_messages=bot_count,
             issues=all_issues,
-            passed=not any(i.severity in ('error', 'critical') for i in all_issues)
+            passed=not any(i.severity in ('error', 'critical') for i in all_issues),
+            issue_counts=Counter(i.issue_type for i in all_issues),
+            has_error_leak=any(
+                i.issue_type == 'non_human_pattern' and 'error' in i.description.lower()
+                for i in all_issues
+            )
         )
 
+        _ANALYSIS_CACHE[cache_key] = result
         return result
 
     def find_latest_log(self, test_name_pattern: str) -> Optional[Path]:
@@ -391,32 +487,104 @@ class LogQualityAnalyzer:
         Returns:
             Path to the most recent matching log, or None
         """
-        matching_logs = []
         pattern = test_name_pattern.lower().replace(' ', '_')
 
-        for log_file in self.logs_dir.glob('*.log'):
-            if pattern in log_file.name.lower():
-                matching_logs.append(log_file)
+        latest: Optional[Path] = None
+        latest_mtime = -1.0
 
-        if not matching_logs:
+        # os.scandir carries a cached stat result with each entry, so one
+        # directory pass replaces glob plus a stat syscall per candidate.
+        try:
+            entries = os.scandir(self.logs_dir)
+        except FileNotFoundError:
             return None
 
-        # Sort by modification time, return newest
-        return max(matching_logs, key=lambda p: p.stat().st_mtime)
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.log') or pattern not in name.lower():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest = Path(entry.path)
+
+        return latest
+
+    def _minhash_signature(self, words: set) -> tuple[int, ...]:
+        """MinHash signature of a token set (one minimum per salted hash)"""
+        if not words:
+            return (0,) * self._MINHASH_PERMS
+        return tuple(
+            min(hash((seed, word)) for word in words)
+            for seed in range(self._MINHASH_PERMS)
+        )
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity ratio between two texts"""
-        # Simple word-based Jaccard similarity
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+    def _near_duplicate_pairs(self, bot_messages: list[LogMessage]):
+        """
+        Yield (i, j, similarity) for near-duplicate bot message pairs
+        (0.85 < similarity < 1.0, i < j).
+
+        LSH bucketing makes candidate generation roughly linear in the
+        number of messages instead of comparing every pair.
+        """
+        # Tokenize each message exactly once and intern every word to a
+        # small int. The signature loop hashes a (seed, token) pair per
+        # permutation per word, and integer tokens hash far cheaper than
+        # repeated strings; set intersections get the same benefit.
+        vocabulary: dict[str, int] = {}
+        word_sets: list[set[int]] = []
+        for msg in bot_messages:
+            ids = set()
+            for word in msg.text.lower().split():
+                word_id = vocabulary.get(word)
+                if word_id is None:
+                    word_id = vocabulary[word] = len(vocabulary)
+                ids.add(word_id)
+            word_sets.append(ids)
+
+        signatures = [self._minhash_signature(words) for words in word_sets]
+
+        buckets: dict[tuple, list[int]] = {}
+        for idx, signature in enumerate(signatures):
+            for band in range(self._LSH_BANDS):
+                rows = signature[band * self._LSH_ROWS:(band + 1) * self._LSH_ROWS]
+                buckets.setdefault((band, rows), []).append(idx)
+
+        candidates = set()
+        for bucket in buckets.values():
+            for pos, i in enumerate(bucket):
+                for j in bucket[pos + 1:]:
+                    candidates.add((i, j))
+
+        for i, j in sorted(candidates):
+            # Jaccard is bounded above by the smaller set's size over the
+            # larger's, so pairs whose word counts differ too much can
+            # never clear the 0.85 threshold - skip them on two len calls.
+            size_i, size_j = len(word_sets[i]), len(word_sets[j])
+            if min(size_i, size_j) <= 0.85 * max(size_i, size_j):
+                continue
+            # The fraction of agreeing signature components estimates the
+            # Jaccard similarity; pairs estimated far below the 0.85
+            # threshold (>5 sigma at 64 components) skip the exact check.
+            matching = sum(a == b for a, b in zip(signatures[i], signatures[j]))
+            if matching / self._MINHASH_PERMS < 0.6:
+                continue
+            similarity = self._jaccard(word_sets[i], word_sets[j])
+            if 0.85 < similarity < 1.0:  # Very similar but not exact
+                yield i, j, similarity
 
+    @staticmethod
+    def _jaccard(words1: set, words2: set) -> float:
+        """Jaccard similarity of two pre-tokenized token sets"""
         if not words1 or not words2:
             return 0.0
+        return len(words1 & words2) / len(words1 | words2)
 
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union)
+    def _calculate_similarity(self, text1: str, text2: str) -> float:
+        """Calculate similarity ratio between two texts"""
+        # Simple word-based Jaccard similarity
+        return self._jaccard(set(text1.lower().split()), set(text2.lower().split()))
 
     def _find_repeated_phrases(self, text: str, min_words: int = 3, min_occurrences: int = 2) -> list[str]:
         """Find phrases that are repeated in the text"""
@@ -426,16 +594,18 @@ class LogQualityAnalyzer:
         if len(words) < min_words * min_occurrences:
             return repeated
 
-        # Check for repeated n-grams
+        # Check for repeated n-grams. Counting word tuples with Counter keeps
+        # the counting in C, and only phrases that actually repeat pay for a
+        # join back into a string.
         for n in range(min_words, min(6, len(words) // 2)):
-            ngrams = {}
-            for i in range(len(words) - n + 1):
-                phrase = ' '.join(words[i:i+n])
-                ngrams[phrase] = ngrams.get(phrase, 0) + 1
-
-            for phrase, count in ngrams.items():
-                if count >= min_occurrences:
-                    repeated.append(phrase)
+            ngrams = Counter(
+                tuple(words[i:i + n]) for i in range(len(words) - n + 1)
+            )
+            repeated.extend(
+                ' '.join(phrase)
+                for phrase, count in ngrams.items()
+                if count >= min_occurrences
+            )
 
         return repeated
 
@@ -457,9 +627,14 @@ def format_analysis_report(result: LogAnalysisResult) -> str:
         lines.append("\nISSUES FOUND:")
         lines.append("-" * 70)
 
-        # Group by severity
+        # Group by severity in a single pass instead of re-filtering the
+        # issue list once per severity level
+        by_severity: dict[str, list[QualityIssue]] = {}
+        for issue in result.issues:
+            by_severity.setdefault(issue.severity, []).append(issue)
+
         for severity in ['critical', 'error', 'warning']:
-            severity_issues = [i for i in result.issues if i.severity == severity]
+            severity_issues = by_severity.get(severity, [])
             if severity_issues:
                 lines.append(f"\n[{severity.upper()}] ({len(severity_issues)} issues)")
                 for issue in severity_issues:
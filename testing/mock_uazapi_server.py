@@ -9,205 +9,433 @@ This server mimics the UAZAPI endpoints that the BotGenerator uses:
 It captures all outgoing messages so they can be inspected by tests.
 """
 
-from fastapi import FastAPI, Request, Header
+from fastapi import FastAPI, Request, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from collections import deque
 from datetime import datetime
+from itertools import count, islice
 from typing import Optional
-import json
+import asyncio
+import bisect
+import logging
+import os
 import uuid
+from functools import lru_cache
+
+import orjson
+from pydantic import BaseModel, ConfigDict
+
+# Capture logging is debug-level and lazily formatted: printing to stdout
+# inside the handlers blocks the event loop on terminal I/O under bursts.
+logger = logging.getLogger("mock_uazapi")
 
 app = FastAPI(
     title="Mock UAZAPI Server",
     description="Mock server for testing WhatsApp bot conversations",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson emits bytes directly and is several times faster than the
+    # stdlib encoder behind the default JSONResponse; every send and poll
+    # round-trips JSON, so the encoder sits on the hot path.
+    default_response_class=ORJSONResponse
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Every client here is the bot or a test script, not a browser, and the
+# CORS middleware taxes each request with header work. Keep it opt-in for
+# anyone poking at the server from a browser dashboard.
+if os.getenv("MOCK_ENABLE_CORS"):
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+# Per-phone history is a ring buffer: /message/find is always bounded by
+# its limit (default 20), so anything beyond the cap can never be served
+# and would only grow memory over long soak runs.
+SIMULATED_HISTORY_CAP = 500
 
 # Storage for captured messages and simulated history
 captured_messages: list[dict] = []
-simulated_history: dict[str, list[dict]] = {}  # phone -> messages
+simulated_history: dict[str, deque] = {}  # phone -> ring of messages
+
+# Secondary index: phone -> captured messages for that phone. The per-phone
+# lists hold the same dict objects as captured_messages, so the only extra
+# memory is the list pointers and /captured/phone/{phone} becomes a dict
+# lookup instead of a scan over every captured message.
+captured_by_phone: dict[str, list[dict]] = {}
+
+# Same idea keyed by message type ("text", "menu_button", ...), so
+# /captured?type=... serves a prebuilt list instead of filtering the full
+# chronological log per request.
+captured_by_type: dict[str, list[dict]] = {}
+
+# Parallel column of unix timestamps, kept in lockstep with
+# captured_messages (appends are insertion-ordered), so time-based lookups
+# can binary-search a flat int list instead of scanning dicts.
+_captured_timestamps: list[int] = []
+
+# Shared empty result for history lookups on unknown phones (serializes as
+# a JSON array); avoids allocating a fresh empty list per cold lookup
+_EMPTY: tuple = ()
+
+# Phones that have had at least one capture, plus a shared miss response
+# for /captured/phone polls that land before the bot answers.
+_seen_phones: set[str] = set()
+_EMPTY_RESPONSE = {"count": 0, "next_since": 0, "messages": []}
+
+# Notified whenever a new message is captured, so /captured/wait long-polls
+# can block until something arrives instead of clients busy-polling.
+captured_condition = asyncio.Condition()
+
+# Capture debug lines are queued and emitted by a background task so the
+# handlers never block on logging I/O; formatting stays lazy (fmt + args
+# are enqueued, never rendered unless DEBUG is on).
+_log_queue: asyncio.Queue = asyncio.Queue()
+
+
+def _log_capture(fmt: str, *args) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_queue.put_nowait((fmt, args))
+
+
+async def _drain_log_queue() -> None:
+    while True:
+        fmt, args = await _log_queue.get()
+        logger.debug(fmt, *args)
+
+
+@app.on_event("startup")
+async def _start_log_drain() -> None:
+    asyncio.get_running_loop().create_task(_drain_log_queue())
+
+
+# Typed views over the incoming payloads. The handlers keep parsing the
+# raw body with orjson (the parsed dict is retained as raw_payload), then
+# run it through pydantic's rust-backed validator once for typed attribute
+# access instead of scattered body.get() calls. extra="allow" keeps any
+# unknown keys visible through raw_payload.
+class SendTextBody(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    number: Optional[str] = None
+    text: Optional[str] = None
+
+
+class SendMenuBody(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    number: Optional[str] = None
+    text: Optional[str] = None
+    type: str = "unknown"
+    choices: Optional[list] = None
+    sections: Optional[list] = None
+    buttonText: Optional[str] = None
+    footerText: Optional[str] = None
+
+
+class SendContactBody(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    number: Optional[str] = None
+    fullName: Optional[str] = None
+    phoneNumber: Optional[str] = None
+    organization: Optional[str] = None
+    email: Optional[str] = None
+
+
+class FindBody(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    chatid: str = ""
+    limit: int = 20
+
+
+# Message IDs only need to be unique; uuid4 per message costs a urandom
+# syscall plus 36 chars of formatting. A per-run nonce keeps IDs distinct
+# across server restarts, the counter keeps them distinct within the run.
+_run_nonce = uuid.uuid4().hex[:8]
+_id_counter = count(1)
+
+
+def _next_id() -> str:
+    return f"{_run_nonce}-{next(_id_counter)}"
+
+
+# The /send/* success reply only varies by message ID, so the JSON shell
+# is pre-encoded once and the ID spliced in as bytes, skipping the
+# serializer entirely on the bot's hottest round-trip.
+_SEND_OK_PRE = b'{"success":true,"messageId":"'
+_SEND_OK_POST = b'","status":"sent"}'
+
+
+def _send_ok(message_id: str) -> Response:
+    return Response(
+        content=_SEND_OK_PRE + message_id.encode("ascii") + _SEND_OK_POST,
+        media_type="application/json",
+    )
+
+
+_CHAT_SUFFIX = "@s.whatsapp.net"
+
+
+@lru_cache(maxsize=2048)
+def _chatid(phone: str) -> str:
+    """Memoized phone -> chatid mapping (tests reuse a handful of phones)"""
+    return f"{phone}{_CHAT_SUFFIX}"
+
+
+async def _parse_body(request: Request) -> dict:
+    """Parse a JSON request body with orjson (bypasses starlette's stdlib json)"""
+    return orjson.loads(await request.body())
+
+
+def _view(m: dict) -> dict:
+    """
+    Rebuild the legacy wire shape of a captured message.
+
+    Stored captures keep only the small indexed fields plus raw_payload;
+    the per-type convenience mirrors (text, menu fields, contact fields)
+    are derived here on read so they are not duplicated in memory and
+    re-encoded on every response.
+    """
+    raw = m["raw_payload"]
+    mtype = m["type"]
+    if mtype == "contact":
+        extra = {
+            "fullName": raw.get("fullName"),
+            "phoneNumber": raw.get("phoneNumber"),
+            "organization": raw.get("organization"),
+            "email": raw.get("email"),
+        }
+    elif mtype.startswith("menu_"):
+        extra = {
+            "text": raw.get("text"),
+            "menu_type": mtype[5:],
+            "choices": raw.get("choices"),
+            "sections": raw.get("sections"),
+            "button_text": raw.get("buttonText"),
+            "footer_text": raw.get("footerText"),
+        }
+    else:
+        extra = {"text": raw.get("text")}
+    return {**m, **extra}
+
+
+def _views(messages: list[dict]) -> list[dict]:
+    return [_view(m) for m in messages]
+
+
+async def record_capture(captured: dict):
+    """Append a captured message and wake any /captured/wait long-pollers"""
+    async with captured_condition:
+        captured_messages.append(captured)
+        _captured_timestamps.append(captured["timestamp_unix"])
+        phone = captured.get("phone")
+        if phone is not None:
+            captured_by_phone.setdefault(phone, []).append(captured)
+            _seen_phones.add(phone)
+        captured_by_type.setdefault(captured["type"], []).append(captured)
+        captured_condition.notify_all()
 
 
 @app.post("/send/text")
 async def send_text(request: Request, token: Optional[str] = Header(None)):
     """Mock endpoint for sending text messages (matches UAZAPI /send/text)"""
-    body = await request.json()
+    body = await _parse_body(request)
+    payload = SendTextBody.model_validate(body)
 
-    message_id = str(uuid.uuid4())
+    message_id = _next_id()
     timestamp = datetime.now()
+    ts_iso = timestamp.isoformat()
+    ts_unix = int(timestamp.timestamp())
+    phone = payload.number
+    text = payload.text
 
     captured = {
         "id": message_id,
         "type": "text",
-        "timestamp": timestamp.isoformat(),
-        "timestamp_unix": int(timestamp.timestamp()),
-        "phone": body.get("number"),
-        "text": body.get("text"),
+        "timestamp": ts_iso,
+        "timestamp_unix": ts_unix,
+        "phone": phone,
         "raw_payload": body,
         "token_present": token is not None
     }
 
-    captured_messages.append(captured)
+    await record_capture(captured)
 
     # Also add to simulated history for this phone
-    phone = body.get("number", "")
-    if phone not in simulated_history:
-        simulated_history[phone] = []
-
-    simulated_history[phone].append({
+    phone = phone or ""
+    simulated_history.setdefault(phone, deque(maxlen=SIMULATED_HISTORY_CAP)).append({
         "id": message_id,
-        "chatid": f"{phone}@s.whatsapp.net",
-        "text": body.get("text"),
+        "chatid": _chatid(phone),
+        "text": text,
         "fromMe": True,
-        "timestamp": int(timestamp.timestamp()),
+        "timestamp": ts_unix,
         "type": "text"
     })
 
-    print(f"[CAPTURED TEXT] To: {phone} | Message: {body.get('text', '')[:80]}...")
+    _log_capture("[CAPTURED TEXT] To: %s | Message: %.80s...", phone, text or "")
 
     # Return success response like UAZAPI would
-    return {
-        "success": True,
-        "messageId": message_id,
-        "status": "sent"
-    }
+    return _send_ok(message_id)
 
 
 @app.post("/send/menu")
 async def send_menu(request: Request, token: Optional[str] = Header(None)):
     """Mock endpoint for sending buttons/menus (matches UAZAPI /send/menu)"""
-    body = await request.json()
+    body = await _parse_body(request)
+    payload = SendMenuBody.model_validate(body)
 
-    message_id = str(uuid.uuid4())
+    message_id = _next_id()
     timestamp = datetime.now()
+    ts_iso = timestamp.isoformat()
+    ts_unix = int(timestamp.timestamp())
+    phone = payload.number
+    text = payload.text
 
-    menu_type = body.get("type", "unknown")
+    menu_type = payload.type
 
     captured = {
         "id": message_id,
         "type": f"menu_{menu_type}",
-        "timestamp": timestamp.isoformat(),
-        "timestamp_unix": int(timestamp.timestamp()),
-        "phone": body.get("number"),
-        "text": body.get("text"),
-        "menu_type": menu_type,
-        "choices": body.get("choices"),
-        "sections": body.get("sections"),
-        "button_text": body.get("buttonText"),
-        "footer_text": body.get("footerText"),
+        "timestamp": ts_iso,
+        "timestamp_unix": ts_unix,
+        "phone": phone,
         "raw_payload": body,
         "token_present": token is not None
     }
 
-    captured_messages.append(captured)
+    await record_capture(captured)
 
     # Add to simulated history
-    phone = body.get("number", "")
-    if phone not in simulated_history:
-        simulated_history[phone] = []
-
-    simulated_history[phone].append({
+    phone = phone or ""
+    simulated_history.setdefault(phone, deque(maxlen=SIMULATED_HISTORY_CAP)).append({
         "id": message_id,
-        "chatid": f"{phone}@s.whatsapp.net",
-        "text": body.get("text"),
+        "chatid": _chatid(phone),
+        "text": text,
         "fromMe": True,
-        "timestamp": int(timestamp.timestamp()),
+        "timestamp": ts_unix,
         "type": menu_type
     })
 
-    print(f"[CAPTURED MENU] To: {phone} | Type: {menu_type} | Text: {body.get('text', '')[:50]}...")
+    _log_capture("[CAPTURED MENU] To: %s | Type: %s | Text: %.50s...", phone, menu_type, text or "")
 
-    return {
-        "success": True,
-        "messageId": message_id,
-        "status": "sent"
-    }
+    return _send_ok(message_id)
 
 
 @app.post("/message/find")
 async def find_messages(request: Request, token: Optional[str] = Header(None)):
     """Mock endpoint for retrieving message history (matches UAZAPI /message/find)"""
-    body = await request.json()
-
-    chatid = body.get("chatid", "")
-    limit = body.get("limit", 20)
-
-    # Extract phone from chatid (e.g., "34612345678@s.whatsapp.net" -> "34612345678")
-    phone = chatid.replace("@s.whatsapp.net", "")
-
-    # Return simulated history for this phone
-    history = simulated_history.get(phone, [])
-
-    # Return most recent messages up to limit
-    return history[-limit:]
+    body = await _parse_body(request)
+
+    payload = FindBody.model_validate(body)
+    chatid = payload.chatid
+    limit = payload.limit
+
+    # Extract phone from chatid (e.g., "34612345678@s.whatsapp.net" -> "34612345678");
+    # the suffix only ever appears at the end, so slice instead of replace-scan
+    if chatid.endswith(_CHAT_SUFFIX):
+        phone = chatid[:-len(_CHAT_SUFFIX)]
+    else:
+        phone = chatid
+
+    # Unknown or not-yet-seen phones are the common case at test start;
+    # bail out before any slicing work
+    history = simulated_history.get(phone)
+    if not history:
+        return _EMPTY
+
+    # Return the most recent messages up to limit. When the whole ring fits
+    # (the common case: default limit 20 against short conversations), a
+    # straight list() copy beats setting up islice bounds.
+    size = len(history)
+    if size <= limit:
+        return list(history)
+    return list(islice(history, size - limit, size))
 
 
 @app.post("/send/contact")
 async def send_contact(request: Request, token: Optional[str] = Header(None)):
     """Mock endpoint for sending contact cards/vCards (matches UAZAPI /send/contact)"""
-    body = await request.json()
+    body = await _parse_body(request)
+
+    payload = SendContactBody.model_validate(body)
 
-    message_id = str(uuid.uuid4())
+    message_id = _next_id()
     timestamp = datetime.now()
+    ts_iso = timestamp.isoformat()
+    ts_unix = int(timestamp.timestamp())
+    phone = payload.number
 
     captured = {
         "id": message_id,
         "type": "contact",
-        "timestamp": timestamp.isoformat(),
-        "timestamp_unix": int(timestamp.timestamp()),
-        "phone": body.get("number"),
-        "fullName": body.get("fullName"),
-        "phoneNumber": body.get("phoneNumber"),
-        "organization": body.get("organization"),
-        "email": body.get("email"),
+        "timestamp": ts_iso,
+        "timestamp_unix": ts_unix,
+        "phone": phone,
         "raw_payload": body,
         "token_present": token is not None
     }
 
-    captured_messages.append(captured)
+    await record_capture(captured)
 
     # Add to simulated history
-    phone = body.get("number", "")
-    if phone not in simulated_history:
-        simulated_history[phone] = []
-
-    simulated_history[phone].append({
+    phone = phone or ""
+    simulated_history.setdefault(phone, deque(maxlen=SIMULATED_HISTORY_CAP)).append({
         "id": message_id,
-        "chatid": f"{phone}@s.whatsapp.net",
+        "chatid": _chatid(phone),
         "contact": {
-            "fullName": body.get("fullName"),
-            "phoneNumber": body.get("phoneNumber"),
-            "organization": body.get("organization")
+            "fullName": payload.fullName,
+            "phoneNumber": payload.phoneNumber,
+            "organization": payload.organization
         },
         "fromMe": True,
-        "timestamp": int(timestamp.timestamp()),
+        "timestamp": ts_unix,
         "type": "contact"
     })
 
-    print(f"[CAPTURED CONTACT] To: {phone} | Name: {body.get('fullName')} | Phone: {body.get('phoneNumber')}")
+    _log_capture("[CAPTURED CONTACT] To: %s | Name: %s | Phone: %s", phone, payload.fullName, payload.phoneNumber)
 
-    return {
-        "success": True,
-        "messageId": message_id,
-        "status": "sent"
-    }
+    return _send_ok(message_id)
 
 
 # === Test Control Endpoints ===
 
 @app.get("/captured")
-async def get_captured():
-    """Get all captured outgoing messages"""
+async def get_captured(
+    offset: int = 0,
+    limit: Optional[int] = None,
+    phone: Optional[str] = None,
+    type: Optional[str] = None,
+):
+    """
+    Get captured outgoing messages.
+
+    Pass `offset` (the `next_offset` of a previous call) to fetch only what
+    arrived since then - repeated polls then cost O(new) instead of
+    re-serializing the whole capture list every time.
+
+    `phone` and `type` filter server-side via the capture indexes, so
+    assertion helpers get the slice they need instead of downloading and
+    scanning the full list client-side. `offset` then counts within the
+    filtered view.
+    """
+    if phone is not None:
+        messages = captured_by_phone.get(phone, [])
+        # Per-phone lists are short (one conversation), so filtering them
+        # by type beats intersecting the two indexes.
+        if type is not None:
+            messages = [m for m in messages if m["type"] == type]
+    elif type is not None:
+        messages = captured_by_type.get(type, [])
+    else:
+        messages = captured_messages
+    if offset or limit:
+        messages = messages[offset:offset + limit] if limit else messages[offset:]
     return {
-        "count": len(captured_messages),
-        "messages": captured_messages
+        "count": len(messages),
+        "cursor": len(captured_messages),
+        "next_offset": offset + len(messages),
+        "messages": _views(messages)
     }
 
 
@@ -216,28 +444,146 @@ async def get_latest_captured(count: int = 1):
     """Get the latest N captured messages"""
     return {
         "count": min(count, len(captured_messages)),
-        "messages": captured_messages[-count:] if captured_messages else []
+        "cursor": len(captured_messages),
+        "messages": _views(captured_messages[-count:]) if captured_messages else []
+    }
+
+
+@app.get("/captured/wait")
+async def wait_for_captured(
+    since: int = 0,
+    phone: Optional[str] = None,
+    timeout: float = 30,
+    exclude_contains: Optional[str] = None,
+):
+    """
+    Long-poll: block until more than `since` messages have been captured
+    (optionally only counting messages for `phone`), or until timeout.
+    Returns the new messages plus the current total count as a cursor.
+
+    `exclude_contains` drops messages whose text contains the given
+    substring (e.g. admin notifications) server-side, so such wake-ups
+    keep the poller blocked instead of returning an empty batch.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    def new_messages() -> list[dict]:
+        new = captured_messages[since:]
+        if phone is not None:
+            new = [m for m in new if m.get("phone") == phone]
+        if exclude_contains:
+            new = [
+                m for m in new
+                if exclude_contains not in (m["raw_payload"].get("text") or "")
+            ]
+        return new
+
+    async with captured_condition:
+        while True:
+            messages = new_messages()
+            if messages:
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(captured_condition.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                messages = new_messages()
+                break
+
+        # Build the response while still holding the condition: leaving the
+        # block can yield to the event loop, and a capture landing between
+        # the message snapshot and the cursor read would advance the
+        # client's cursor past messages it never saw.
+        return {
+            "count": len(captured_messages),
+            "cursor": len(captured_messages),
+            "messages": _views(messages)
+        }
+
+
+@app.get("/captured/since/{t}")
+async def get_captured_since(t: int):
+    """
+    Get messages captured at or after unix timestamp t.
+
+    Binary-searches the timestamp column, so the lookup is O(log N) plus
+    the size of the returned tail.
+    """
+    i = bisect.bisect_left(_captured_timestamps, t)
+    messages = captured_messages[i:]
+    return {
+        "count": len(messages),
+        "cursor": len(captured_messages),
+        "messages": _views(messages)
     }
 
 
 @app.get("/captured/phone/{phone}")
-async def get_captured_for_phone(phone: str):
-    """Get captured messages for a specific phone number"""
-    phone_messages = [m for m in captured_messages if m.get("phone") == phone]
+async def get_captured_for_phone(phone: str, since: int = 0):
+    """
+    Get captured messages for a specific phone number.
+
+    `since` is the offset cursor echoed back as next_since: pass the
+    previous call's value to receive only messages captured after it,
+    instead of re-downloading the whole per-phone list each poll.
+    """
+    # Polling loops hammer this endpoint before the bot has replied; on a
+    # miss, hand back the shared empty response instead of building one.
+    if phone not in _seen_phones:
+        return _EMPTY_RESPONSE
+    phone_messages = captured_by_phone.get(phone, [])
+    total = len(phone_messages)
+    new = phone_messages[since:] if since else phone_messages
     return {
-        "count": len(phone_messages),
-        "messages": phone_messages
+        "count": len(new),
+        "next_since": total,
+        "messages": _views(new)
     }
 
 
+@app.get("/captured/phone/{phone}/count")
+async def get_captured_count_for_phone(phone: str):
+    """Lightweight per-phone capture count (quiescence probe for testers)"""
+    return {"count": len(captured_by_phone.get(phone, _EMPTY))}
+
+
 @app.delete("/captured")
 async def clear_captured():
     """Clear all captured messages"""
     captured_messages.clear()
+    captured_by_phone.clear()
+    captured_by_type.clear()
+    _captured_timestamps.clear()
+    _seen_phones.clear()
     print("[CLEARED] All captured messages cleared")
     return {"success": True, "message": "Captured messages cleared"}
 
 
+@app.delete("/captured/phone/{phone}")
+async def clear_captured_for_phone(phone: str):
+    """
+    Clear the per-phone capture index for one phone.
+
+    Scoped so parallel testers can reset themselves without wiping each
+    other. The global chronological list is left untouched (its wait
+    cursors stay valid for other clients) and is bounded by the DELETE
+    /all that test runs issue up front.
+    """
+    removed = captured_by_phone.pop(phone, None)
+    _seen_phones.discard(phone)
+    return {"success": True, "removed": len(removed) if removed else 0}
+
+
+@app.delete("/history/phone/{phone}")
+async def clear_history_for_phone(phone: str):
+    """Clear simulated message history for one phone"""
+    removed = simulated_history.pop(phone, None)
+    return {"success": True, "removed": len(removed) if removed else 0}
+
+
 @app.delete("/history")
 async def clear_history():
     """Clear simulated message history"""
@@ -250,6 +596,10 @@ async def clear_history():
 async def clear_all():
     """Clear both captured messages and history"""
     captured_messages.clear()
+    captured_by_phone.clear()
+    captured_by_type.clear()
+    _captured_timestamps.clear()
+    _seen_phones.clear()
     simulated_history.clear()
     print("[CLEARED] All data cleared")
     return {"success": True, "message": "All data cleared"}
@@ -270,24 +620,27 @@ async def inject_history(request: Request):
         ]
     }
     """
-    body = await request.json()
+    body = await _parse_body(request)
     phone = body.get("phone", "")
     messages = body.get("messages", [])
 
-    if phone not in simulated_history:
-        simulated_history[phone] = []
-
     base_timestamp = int(datetime.now().timestamp()) - (len(messages) * 60)
-
-    for i, msg in enumerate(messages):
-        simulated_history[phone].append({
-            "id": str(uuid.uuid4()),
-            "chatid": f"{phone}@s.whatsapp.net",
+    chatid = _chatid(phone)
+
+    # Build the batch in one comprehension and extend the ring in a single
+    # call rather than paying a bound-method append per message.
+    new_items = [
+        {
+            "id": _next_id(),
+            "chatid": chatid,
             "text": msg.get("text", ""),
             "fromMe": msg.get("fromMe", False),
             "timestamp": base_timestamp + (i * 60),
             "type": msg.get("type", "text")
-        })
+        }
+        for i, msg in enumerate(messages)
+    ]
+    simulated_history.setdefault(phone, deque(maxlen=SIMULATED_HISTORY_CAP)).extend(new_items)
 
     print(f"[INJECTED] {len(messages)} messages for {phone}")
     return {"success": True, "injected_count": len(messages)}
@@ -317,8 +670,10 @@ async def root():
                 "POST /message/find - Get message history"
             ],
             "test_control": [
-                "GET /captured - Get all captured messages",
+                "GET /captured?offset=N&limit=M - Get captured messages (cursor-friendly)",
                 "GET /captured/latest?count=N - Get latest N messages",
+                "GET /captured/wait?since=N&timeout=S - Long-poll for new messages",
+                "GET /captured/since/{t} - Messages captured at/after unix time t",
                 "GET /captured/phone/{phone} - Get messages for phone",
                 "DELETE /captured - Clear captured messages",
                 "DELETE /history - Clear simulated history",
@@ -332,10 +687,41 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
+
+    # uvicorn[standard] ships uvloop + httptools; request them explicitly so
+    # the high-rate capture/long-poll traffic runs on the fast event loop and
+    # HTTP parser, falling back to the defaults on a minimal uvicorn install
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop_impl, http_impl = "uvloop", "httptools"
+    except ImportError:
+        loop_impl, http_impl = "auto", "auto"
+
+    logging.basicConfig(level=os.environ.get("MOCK_LOG_LEVEL", "INFO"))
+
+    # Default to one worker: captured_messages/simulated_history live in
+    # process memory, so multiple workers only make sense for stress runs
+    # that do not assert on captured state.
+    workers = int(os.environ.get("MOCK_WORKERS", "1"))
+
     print("=" * 60)
     print("Mock UAZAPI Server Starting")
     print("=" * 60)
     print("This server mimics UAZAPI for testing your WhatsApp bot.")
     print("Set WHATSAPP_API_URL=http://localhost:8080 in your .env")
+    if workers > 1:
+        print(f"WARNING: MOCK_WORKERS={workers} - captured state is per-worker;")
+        print("         capture assertions are only reliable with 1 worker.")
     print("=" * 60)
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        "mock_uazapi_server:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8080,
+        loop=loop_impl,
+        http=http_impl,
+        workers=workers,
+        # uvicorn's per-request access log costs a formatted line per call;
+        # warnings and errors still come through
+        log_level=os.environ.get("MOCK_UVICORN_LOG", "warning"),
+    )
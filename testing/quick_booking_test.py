@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 """Quick booking test - 2 people, Saturday, chorizo rice x2"""
 
+import os
 import sys
-sys.path.insert(0, '/home/jaime/Documents/projects/botGenerator/testing')
+
+# Resolve sibling modules relative to this file instead of a hard-coded
+# machine path, and only touch sys.path when needed (re-imports of an
+# already-reachable testing dir would otherwise grow the path each run).
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 from conversation_tester import ConversationTester, TestConfig
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Run every standalone scenario against a single mock + bot pair.
+
+Each run_*_test.py boots its own servers, so N scenarios pay N dotnet
+startups. This driver calls setup() once and loops run_turns() per
+scenario against the already-running pair.
+"""
+
+import sys
+
+from _runner_common import ScenarioRunner
+import run_full_test
+import run_invalid_rice_test
+
+SCENARIOS = [
+    run_full_test.SCENARIO,
+    run_invalid_rice_test.SCENARIO,
+]
+
+def main():
+    print("="*60)
+    print("AUTOMATED WHATSAPP BOT TEST SUITE")
+    print("="*60 + "\n")
+
+    runner = ScenarioRunner()
+    failed = 0
+
+    try:
+        if not runner.setup():
+            return 1
+
+        for scenario in SCENARIOS:
+            result = runner.run_turns(
+                scenario["name"],
+                scenario["turns"],
+                scenario["phone"],
+                banner=scenario["banner"],
+            )
+            if scenario["require_pass"] and not result.passed:
+                failed += 1
+
+        print("="*60)
+        print(f"SUITE RESULT: {len(SCENARIOS) - failed}/{len(SCENARIOS)} scenarios passed")
+        print("="*60)
+
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    finally:
+        runner.cleanup()
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,9 @@ Run this after manually starting:
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 from conversation_tester import ConversationTester, TestConfig
 
@@ -10,12 +10,32 @@ import sys
 import os
 import shutil
 
+import requests
+
 # Add parent directory for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from conversation_tester import ConversationTester, TestConfig
 
 
+def _wait_ready(url: str, timeout: float = 60.0) -> bool:
+    """
+    Poll `url` with exponential backoff until it answers (any status below
+    500 counts as up), or `timeout` elapses.
+    """
+    deadline = time.time() + timeout
+    delay = 0.25
+    while time.time() < deadline:
+        try:
+            if requests.get(url, timeout=1).status_code < 500:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 2.0)
+    return False
+
+
 def setup_test_environment():
     """Set up test environment with mock server and bot"""
     print("=" * 60)
@@ -60,26 +80,36 @@ def setup_test_environment():
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE
     )
-    time.sleep(2)
 
-    if mock_server.poll() is not None:
+    if not _wait_ready("http://localhost:8080/health", timeout=15) or mock_server.poll() is not None:
         print("[ERROR] Mock server failed to start")
         return None, None, None
 
     print("[SETUP] Mock server started successfully")
 
-    # Start the bot
+    # Start the bot from a prebuilt binary. `dotnet run` re-compiled the
+    # project on every invocation, which dominated the old warm-up wait;
+    # publishing once and launching the dll starts in a couple of seconds.
     print("[SETUP] Starting bot...")
+    bot_dll = os.path.join("_pub", "BotGenerator.Api.dll")
+    if not os.path.exists(bot_dll):
+        print("[SETUP] Publishing bot (first run only)...")
+        subprocess.run(
+            ["dotnet", "publish", "-c", "Release", "-o", "_pub", "../src/BotGenerator.Api"],
+            check=True,
+        )
     bot_process = subprocess.Popen(
-        ["dotnet", "run", "--project", "../src/BotGenerator.Api"],
+        ["dotnet", bot_dll],
+        env={**os.environ, "ASPNETCORE_ENVIRONMENT": "Development"},
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE
     )
 
+    # A fixed warm-up sleep overpaid on warm builds and underpaid on cold
+    # ones; probe the webhook until the server answers instead.
     print("[SETUP] Waiting for bot to compile and start...")
-    time.sleep(25)  # Give bot time to compile and start
-
-    if bot_process.poll() is not None:
+    ready = _wait_ready("http://localhost:5082/api/webhook/whatsapp-webhook", timeout=60)
+    if not ready or bot_process.poll() is not None:
         print("[ERROR] Bot failed to start")
         mock_server.terminate()
         return None, None, None
@@ -21,6 +21,12 @@ import sys
 import json
 from datetime import datetime
 
+try:
+    import orjson
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
 from conversation_tester import ConversationTester, TestConfig, run_test_suite
 from test_scenarios import (
     get_all_tests,
@@ -29,6 +35,59 @@ from test_scenarios import (
 )
 
 
+# Built once at import; repeated main() invocations (and harness loops
+# driving this module) skip the parser re-construction cost.
+_PARSER = argparse.ArgumentParser(
+    description="Run WhatsApp bot conversation tests",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog=__doc__
+)
+
+_PARSER.add_argument(
+    "--category", "-c",
+    help="Run tests from specific category"
+)
+_PARSER.add_argument(
+    "--list", "-l",
+    action="store_true",
+    help="List available test categories"
+)
+_PARSER.add_argument(
+    "--interactive", "-i",
+    action="store_true",
+    help="Run in interactive mode"
+)
+_PARSER.add_argument(
+    "--test", "-t",
+    help="Run a specific test by name (partial match)"
+)
+_PARSER.add_argument(
+    "--bot-url",
+    default="http://localhost:5000/api/webhook/whatsapp-webhook",
+    help="Bot webhook URL"
+)
+_PARSER.add_argument(
+    "--mock-url",
+    default="http://localhost:8080",
+    help="Mock UAZAPI server URL"
+)
+_PARSER.add_argument(
+    "--phone",
+    default="34612345678",
+    help="Default phone number for tests"
+)
+_PARSER.add_argument(
+    "--timeout",
+    type=int,
+    default=30,
+    help="Response timeout in seconds"
+)
+_PARSER.add_argument(
+    "--output", "-o",
+    help="Output results to JSON file"
+)
+
+
 def interactive_mode(tester: ConversationTester):
     """Run interactive conversation testing"""
     print("\n" + "=" * 60)
@@ -100,57 +159,7 @@ def single_test_mode(tester: ConversationTester, test_name: str):
 
 
 def main():
-    parser = argparse.ArgumentParser(
-        description="Run WhatsApp bot conversation tests",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
-    )
-
-    parser.add_argument(
-        "--category", "-c",
-        help="Run tests from specific category"
-    )
-    parser.add_argument(
-        "--list", "-l",
-        action="store_true",
-        help="List available test categories"
-    )
-    parser.add_argument(
-        "--interactive", "-i",
-        action="store_true",
-        help="Run in interactive mode"
-    )
-    parser.add_argument(
-        "--test", "-t",
-        help="Run a specific test by name (partial match)"
-    )
-    parser.add_argument(
-        "--bot-url",
-        default="http://localhost:5000/api/webhook/whatsapp-webhook",
-        help="Bot webhook URL"
-    )
-    parser.add_argument(
-        "--mock-url",
-        default="http://localhost:8080",
-        help="Mock UAZAPI server URL"
-    )
-    parser.add_argument(
-        "--phone",
-        default="34612345678",
-        help="Default phone number for tests"
-    )
-    parser.add_argument(
-        "--timeout",
-        type=int,
-        default=30,
-        help="Response timeout in seconds"
-    )
-    parser.add_argument(
-        "--output", "-o",
-        help="Output results to JSON file"
-    )
-
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     # List categories
     if args.list:
@@ -239,8 +248,15 @@ def main():
             ]
         }
 
-        with open(args.output, "w") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # orjson serializes the nested results structure several times
+        # faster than stdlib json (whose C accelerator doesn't cover
+        # indent); fall back to json when it isn't installed.
+        if _has_orjson:
+            with open(args.output, "wb") as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.output, "w") as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
         print(f"\nResults saved to: {args.output}")
 
     return 0 if summary["failed_tests"] == 0 else 1
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
+from typing import NamedTuple
 
+# Resolved once per process so cached results stay self-consistent; a
+# per-call date.today() would make identical arguments time-dependent.
+_TODAY = date.today()
 
-@dataclass(frozen=True)
-class ScenarioDateTime:
-    """Reservation date/time for a scenario."""
+
+class ScenarioDateTime(NamedTuple):
+    """Reservation date/time for a scenario.
+
+    A NamedTuple rather than a frozen dataclass: construction is a single
+    C-level tuple __new__ instead of per-field object.__setattr__ calls,
+    and callers only use attribute access so nothing changes for them.
+    """
 
     # dd/MM/yyyy (what the bot expects)
     user_date: str
@@ -19,13 +28,26 @@ class ScenarioDateTime:
 
 
 def _format_user_date(d: date) -> str:
-    return d.strftime("%d/%m/%Y")
+    # Both output formats here are fixed, so plain integer formatting (and
+    # isoformat below, which is C-implemented) skips strftime's
+    # format-string parsing and locale machinery.
+    return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
 
 
 def _format_db_date(d: date) -> str:
-    return d.strftime("%Y-%m-%d")
+    return d.isoformat()
+
+
+@lru_cache(maxsize=16)
+def _base_saturday_ordinal(base_date: date, offset_days: int) -> int:
+    """Ordinal of the first Saturday at least offset_days after base_date."""
+    start = base_date + timedelta(days=offset_days)
+    # Move to next Saturday (weekday: Mon=0..Sun=6; Sat=5)
+    days_until_sat = (5 - start.weekday()) % 7
+    return start.toordinal() + days_until_sat
 
 
+@lru_cache(maxsize=256)
 def get_scenario_datetime(
     scenario_index: int,
     *,
@@ -43,17 +65,14 @@ def get_scenario_datetime(
     if scenario_index < 0:
         raise ValueError("scenario_index must be >= 0")
 
-    today = date.today()
-    base_date = base_date or today
+    base_date = base_date or _TODAY
 
     # Start sufficiently in the future to avoid any special closures configured for near-term dates.
-    start = base_date + timedelta(days=base_week_offset_days)
-
-    # Move to next Saturday (weekday: Mon=0..Sun=6; Sat=5)
-    days_until_sat = (5 - start.weekday()) % 7
-    next_saturday = start + timedelta(days=days_until_sat)
-
-    d = next_saturday + timedelta(days=7 * scenario_index)
+    # The Saturday anchor is cached per (base_date, offset); deriving each
+    # scenario's date is then plain integer math on the ordinal.
+    d = date.fromordinal(
+        _base_saturday_ordinal(base_date, base_week_offset_days) + 7 * scenario_index
+    )
 
     # Prefer safer hours to reduce collisions with existing bookings (we keep DB rows).
     # Avoid 14:00 since it often gets rejected by availability in this dataset.
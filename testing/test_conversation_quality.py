@@ -13,25 +13,60 @@ This module contains 5 comprehensive tests that:
 Run with: python test_conversation_quality.py
 """
 
+import atexit
+import io
+import os
+import random
 import sys
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
-# Add testing directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add testing directory to path (guarded so repeated imports, e.g. under
+# pytest collection, don't keep growing sys.path)
+_here = str(Path(__file__).resolve().parent)
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 from conversation_tester import ConversationTester, TestConfig, run_test_suite
 from log_quality_analyzer import LogQualityAnalyzer, format_analysis_report, LogAnalysisResult
 
+# The analyzer's detection patterns are compiled once at class level, so a
+# single instance can serve every test; re-creating one per test (and a
+# second one in the __main__ block) bought nothing.
+_SHARED_ANALYZER = LogQualityAnalyzer("logs")
+
+
+
+# Turns repeated verbatim across tests share one frozen definition, so
+# identical turns are a single object (stable identity also keeps any
+# future cache keys over turn lists consistent).
+CONFIRM = {"input": "Confirmo", "expected_contains": []}
+NO_EXTRAS = {"input": "Sin tronas ni carrito", "expected_contains": []}
+AT_1400 = {"input": "A las 14:00", "expected_contains": []}
+
+
+def _wait_for_log(path: Path, max_wait: float = 1.0):
+    """Wait until `path` exists and its size has stopped growing."""
+    deadline = time.monotonic() + max_wait
+    last = -1
+    while time.monotonic() < deadline:
+        size = path.stat().st_size if path.exists() else 0
+        if size > 0 and size == last:
+            return
+        last = size
+        time.sleep(0.02)
+
 
 class ConversationQualityTester:
     """
     Tests conversation quality by running scenarios and analyzing the generated logs.
     """
 
-    def __init__(self, logs_dir: str = "logs"):
+    def __init__(self, logs_dir: str = "logs", analyzer: LogQualityAnalyzer = None):
         self.logs_dir = Path(logs_dir)
         # Use port 5082 which is the actual bot port
         self.config = TestConfig(
@@ -41,14 +76,22 @@ class ConversationQualityTester:
             response_timeout=30
         )
         self.tester = ConversationTester(self.config)
-        self.analyzer = LogQualityAnalyzer(str(self.logs_dir))
-        self.results = []
+        if analyzer is not None:
+            self.analyzer = analyzer
+        elif logs_dir == "logs":
+            self.analyzer = _SHARED_ANALYZER
+        else:
+            self.analyzer = LogQualityAnalyzer(str(self.logs_dir))
+        # Per-tester generator: the module-level random functions share one
+        # lock-guarded instance, which parallel tests would contend on.
+        self._rng = random.Random(uuid.uuid4().int)
 
     def run_test_and_analyze(
         self,
         test_name: str,
         turns: list[dict],
-        phone: str = None
+        phone: str = None,
+        clear_before: bool = True
     ) -> tuple[bool, LogAnalysisResult]:
         """
         Run a conversation test and analyze the resulting log.
@@ -57,13 +100,14 @@ class ConversationQualityTester:
             test_name: Name of the test
             turns: List of turn definitions
             phone: Optional phone number
+            clear_before: Clear mock/bot state first. Pass False when the
+                suite has already cleared once and tests run concurrently.
 
         Returns:
             Tuple of (overall_passed, analysis_result)
         """
         # Generate unique numeric phone for this test
-        import random
-        phone = phone or f"34699{random.randint(100000, 999999)}"
+        phone = phone or f"34699{self._rng.randint(100000, 999999)}"
 
         print(f"\n{'#' * 70}")
         print(f"# QUALITY TEST: {test_name}")
@@ -74,14 +118,19 @@ class ConversationQualityTester:
             name=test_name,
             turns=turns,
             phone=phone,
-            clear_before=True
+            clear_before=clear_before
         )
 
-        # Small delay to ensure log is written
-        time.sleep(0.5)
-
-        # Find and analyze the log
-        log_path = self.analyzer.find_latest_log(test_name.replace(' ', '_'))
+        # Analyze the exact log this conversation produced: the result
+        # carries its own log path, so wait for the background writer to
+        # land that file and settle. Globbing for the newest name match
+        # would return the previous run's log for the same test name if
+        # the writer had not flushed yet.
+        log_path = Path(conv_result.log_path) if conv_result.log_path else None
+        if log_path is not None:
+            _wait_for_log(log_path, max_wait=2.0)
+            if not log_path.exists():
+                log_path = None
 
         if not log_path:
             print(f"ERROR: Could not find log file for test: {test_name}")
@@ -98,7 +147,24 @@ class ConversationQualityTester:
         return overall_passed, analysis
 
 
-def test_1_basic_booking_no_duplications():
+_WORKER_STATE = threading.local()
+
+
+def _shared_tester() -> ConversationQualityTester:
+    """
+    One ConversationQualityTester per worker thread, reused across every
+    test that thread runs. The tester's capture cursor is per-conversation
+    state, so a single instance shared across threads would interleave it;
+    a thread-local gives session/analyzer reuse without the race.
+    """
+    tester = getattr(_WORKER_STATE, "tester", None)
+    if tester is None:
+        tester = ConversationQualityTester()
+        _WORKER_STATE.tester = tester
+    return tester
+
+
+def test_1_basic_booking_no_duplications(tester=None, clear_before=True):
     """
     TEST 1: Basic Booking Flow - Verify No Duplications
 
@@ -107,7 +173,7 @@ def test_1_basic_booking_no_duplications():
     - No consecutive identical responses
     - Each response is contextually appropriate
     """
-    tester = ConversationQualityTester()
+    tester = tester or _shared_tester()
 
     test_name = "QualityTest1_BasicBooking_NoDuplications"
     turns = [
@@ -123,10 +189,7 @@ def test_1_basic_booking_no_duplications():
             "input": "Para el proximo sabado",
             "expected_contains": []
         },
-        {
-            "input": "A las 14:00",
-            "expected_contains": []
-        },
+        AT_1400,
         {
             "input": "No queremos arroz gracias",
             "expected_contains": []
@@ -145,19 +208,22 @@ def test_1_basic_booking_no_duplications():
         }
     ]
 
-    passed, analysis = tester.run_test_and_analyze(test_name, turns)
+    passed, analysis = tester.run_test_and_analyze(test_name, turns, clear_before=clear_before)
 
     # Additional checks
     if analysis:
-        duplication_issues = [i for i in analysis.issues if 'duplication' in i.issue_type]
-        if duplication_issues:
-            print(f"\nFAILED: Found {len(duplication_issues)} duplication issues!")
+        duplication_count = sum(
+            count for issue_type, count in analysis.issue_counts.items()
+            if 'duplication' in issue_type
+        )
+        if duplication_count:
+            print(f"\nFAILED: Found {duplication_count} duplication issues!")
             return False
 
     return passed
 
 
-def test_2_topic_switching_coherence():
+def test_2_topic_switching_coherence(tester=None, clear_before=True):
     """
     TEST 2: Topic Switching - Verify Response Coherence
 
@@ -166,7 +232,7 @@ def test_2_topic_switching_coherence():
     - Responses remain coherent and human-like
     - No confused or robotic responses
     """
-    tester = ConversationQualityTester()
+    tester = tester or _shared_tester()
 
     test_name = "QualityTest2_TopicSwitching_Coherence"
     turns = [
@@ -198,29 +264,23 @@ def test_2_topic_switching_coherence():
             "input": "No queremos arroz",
             "expected_contains": []
         },
-        {
-            "input": "Sin tronas ni carrito",
-            "expected_contains": []
-        },
-        {
-            "input": "Confirmo",
-            "expected_contains": []
-        }
+        NO_EXTRAS,
+        CONFIRM
     ]
 
-    passed, analysis = tester.run_test_and_analyze(test_name, turns)
+    passed, analysis = tester.run_test_and_analyze(test_name, turns, clear_before=clear_before)
 
     # Check for non-human patterns
     if analysis:
-        non_human_issues = [i for i in analysis.issues if i.issue_type == 'non_human_pattern']
-        if non_human_issues:
-            print(f"\nFAILED: Found {len(non_human_issues)} non-human response patterns!")
+        non_human_count = analysis.issue_counts['non_human_pattern']
+        if non_human_count:
+            print(f"\nFAILED: Found {non_human_count} non-human response patterns!")
             return False
 
     return passed
 
 
-def test_3_rapid_fire_messages():
+def test_3_rapid_fire_messages(tester=None, clear_before=True):
     """
     TEST 3: Rapid-Fire Messages - Verify No Duplicate Responses
 
@@ -229,7 +289,7 @@ def test_3_rapid_fire_messages():
     - Each response is unique and relevant
     - No message processing errors
     """
-    tester = ConversationQualityTester()
+    tester = tester or _shared_tester()
 
     test_name = "QualityTest3_RapidFire_NoDuplicateResponses"
     turns = [
@@ -261,25 +321,22 @@ def test_3_rapid_fire_messages():
             "input": "Sin extras",
             "expected_contains": []
         },
-        {
-            "input": "Confirmo",
-            "expected_contains": []
-        }
+        CONFIRM
     ]
 
-    passed, analysis = tester.run_test_and_analyze(test_name, turns)
+    passed, analysis = tester.run_test_and_analyze(test_name, turns, clear_before=clear_before)
 
     # Specific check for consecutive duplications
     if analysis:
-        consecutive_dups = [i for i in analysis.issues if i.issue_type == 'consecutive_duplication']
+        consecutive_dups = analysis.issue_counts['consecutive_duplication']
         if consecutive_dups:
-            print(f"\nFAILED: Found {len(consecutive_dups)} consecutive duplicate responses!")
+            print(f"\nFAILED: Found {consecutive_dups} consecutive duplicate responses!")
             return False
 
     return passed
 
 
-def test_4_long_conversation_no_repetition():
+def test_4_long_conversation_no_repetition(tester=None, clear_before=True):
     """
     TEST 4: Long Multi-Turn Conversation - Verify No Repetitive Patterns
 
@@ -288,7 +345,7 @@ def test_4_long_conversation_no_repetition():
     - Changes and corrections
     - Verifies bot doesn't fall into repetitive patterns
     """
-    tester = ConversationQualityTester()
+    tester = tester or _shared_tester()
 
     test_name = "QualityTest4_LongConversation_NoRepetition"
     turns = [
@@ -316,10 +373,7 @@ def test_4_long_conversation_no_repetition():
             "input": "El domingo que viene",
             "expected_contains": []
         },
-        {
-            "input": "A las 14:00",
-            "expected_contains": []
-        },
+        AT_1400,
         {
             "input": "Espera, mejor a las 14:30",
             "expected_contains": []
@@ -350,19 +404,19 @@ def test_4_long_conversation_no_repetition():
         }
     ]
 
-    passed, analysis = tester.run_test_and_analyze(test_name, turns)
+    passed, analysis = tester.run_test_and_analyze(test_name, turns, clear_before=clear_before)
 
     # Check for repetitive text patterns
     if analysis:
-        repetitive_issues = [i for i in analysis.issues if i.issue_type == 'repetitive_text']
-        if repetitive_issues:
-            print(f"\nWARNING: Found {len(repetitive_issues)} repetitive text patterns")
+        repetitive_count = analysis.issue_counts['repetitive_text']
+        if repetitive_count:
+            print(f"\nWARNING: Found {repetitive_count} repetitive text patterns")
             # This might be acceptable in some cases, so just warn
 
     return passed
 
 
-def test_5_error_recovery_graceful():
+def test_5_error_recovery_graceful(tester=None, clear_before=True):
     """
     TEST 5: Error Recovery - Verify Graceful Handling
 
@@ -372,7 +426,7 @@ def test_5_error_recovery_graceful():
     - Strange requests
     Verifies bot handles these gracefully without robotic/error responses
     """
-    tester = ConversationQualityTester()
+    tester = tester or _shared_tester()
 
     test_name = "QualityTest5_ErrorRecovery_GracefulHandling"
     turns = [
@@ -408,30 +462,47 @@ def test_5_error_recovery_graceful():
             "input": "Vale, sin arroz",
             "expected_contains": []
         },
-        {
-            "input": "Sin tronas ni carrito",
-            "expected_contains": []
-        },
-        {
-            "input": "Confirmo",
-            "expected_contains": []
-        }
+        NO_EXTRAS,
+        CONFIRM
     ]
 
-    passed, analysis = tester.run_test_and_analyze(test_name, turns)
+    passed, analysis = tester.run_test_and_analyze(test_name, turns, clear_before=clear_before)
 
     # Check that no error messages leaked through
-    if analysis:
-        error_leaks = [i for i in analysis.issues
-                       if i.issue_type == 'non_human_pattern'
-                       and 'error' in i.description.lower()]
-        if error_leaks:
-            print(f"\nFAILED: Found {len(error_leaks)} error message leaks!")
-            return False
+    if analysis and analysis.has_error_leak:
+        print("\nFAILED: Error messages leaked into bot responses!")
+        return False
 
     return passed
 
 
+class _ThreadLocalStdout(io.TextIOBase):
+    """
+    Routes writes to a per-thread buffer when one is registered, otherwise
+    to the real stream. Lets the parallel quality tests print freely
+    without interleaving their transcripts.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def release(self):
+        self._local.buffer = None
+
+    def write(self, s):
+        target = getattr(self._local, "buffer", None) or self._fallback
+        return target.write(s)
+
+    def flush(self):
+        target = getattr(self._local, "buffer", None) or self._fallback
+        target.flush()
+
+
 def run_all_quality_tests() -> dict:
     """
     Run all 5 quality tests and return summary.
@@ -454,13 +525,47 @@ def run_all_quality_tests() -> dict:
 
     results = []
 
-    for test_name, test_func in tests:
+    # The five tests use distinct randomized phones and write distinct log
+    # files, so they are independent and spend most of their time waiting
+    # on the webhook; run them concurrently. Each worker's prints land in
+    # a per-thread buffer that is written out whole when its test
+    # finishes, so the transcripts stay readable.
+    proxy = _ThreadLocalStdout(sys.stdout)
+
+    # Clear mock/bot state once up front. Each test then runs with
+    # clear_before=False: a per-test clear is a global wipe, so a
+    # late-starting worker would erase a sibling's early captures (same
+    # setup run_test_suite uses for its concurrent path).
+    _shared_tester().tester.clear_state()
+
+    def _run_buffered(test_func):
+        buf = proxy.capture()
         try:
-            passed = test_func()
-            results.append((test_name, passed, None))
+            passed, error = test_func(clear_before=False), None
         except Exception as e:
-            print(f"\nERROR in {test_name}: {e}")
-            results.append((test_name, False, str(e)))
+            # Keep what the test printed before it blew up: the partial
+            # transcript is usually the only clue to why it crashed.
+            passed, error = False, e
+        finally:
+            proxy.release()
+        return passed, buf.getvalue(), error
+
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+            futures = {ex.submit(_run_buffered, fn): name for name, fn in tests}
+            for future in as_completed(futures):
+                test_name = futures[future]
+                passed, output, error = future.result()
+                original_stdout.write(output)
+                if error is not None:
+                    original_stdout.write(f"\nERROR in {test_name}: {error}\n")
+                    results.append((test_name, False, str(error)))
+                else:
+                    results.append((test_name, passed, None))
+    finally:
+        sys.stdout = original_stdout
 
     # Print summary
     print("\n" + "=" * 70)
@@ -489,6 +594,18 @@ def run_all_quality_tests() -> dict:
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout when it isn't a terminal (CI redirects it to a
+    # file): the suite's hundreds of per-line writes collapse into a few
+    # large ones. Interactive runs keep line buffering for liveness.
+    if not sys.stdout.isatty():
+        sys.stdout = io.TextIOWrapper(
+            sys.stdout.buffer,
+            encoding="utf-8",
+            line_buffering=False,
+            write_through=False,
+        )
+        atexit.register(sys.stdout.flush)
+
     print("=" * 70)
     print(" WhatsApp Bot Conversation Quality Tests")
     print("=" * 70)
@@ -505,12 +622,19 @@ if __name__ == "__main__":
         print(" POST-TEST LOG ANALYSIS")
         print("=" * 70)
 
-        analyzer = LogQualityAnalyzer()
-        quality_test_logs = list(Path("logs").glob("*QualityTest*.log"))
+        analyzer = _SHARED_ANALYZER
+        # scandir's DirEntry stat data is cached from the directory read,
+        # so listing and mtime-sorting costs one filesystem pass instead of
+        # a glob plus a stat syscall per log.
+        try:
+            with os.scandir("logs") as it:
+                entries = [e for e in it if e.name.endswith(".log") and "QualityTest" in e.name]
+        except FileNotFoundError:
+            entries = []
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        quality_test_logs = [Path(e.path) for e in entries]
 
         if quality_test_logs:
-            # Sort by modification time
-            quality_test_logs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
 
             total_issues = 0
             for log_path in quality_test_logs[:5]:  # Last 5 quality test logs
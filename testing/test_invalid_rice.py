@@ -2,7 +2,13 @@
 """Test booking with non-existent rice type"""
 
 import sys
-sys.path.insert(0, '/home/jaime/Documents/projects/botGenerator/testing')
+from pathlib import Path
+
+# Resolve the testing directory from this file instead of a hard-coded
+# absolute path; guarded so repeated imports don't keep growing sys.path
+_here = str(Path(__file__).resolve().parent)
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 from conversation_tester import ConversationTester, TestConfig
 
@@ -52,17 +58,11 @@ result = tester.run_conversation(
     clear_before=False
 )
 
-print(f"\n{'='*60}")
-print("FULL CONVERSATION LOG")
-print("="*60)
+# Build the report once and emit it with a single write instead of a few
+# stdout syscalls per turn
+lines = [f"\n{'='*60}", "FULL CONVERSATION LOG", "=" * 60]
 for i, turn in enumerate(result.turns):
-    print(f"\n[Turn {i+1}]")
-    print(f"  User: {turn.user_input}")
-    if turn.bot_response:
-        print(f"  Bot: {turn.bot_response.text}")
-    else:
-        print(f"  Bot: (no response)")
-
-print(f"\n{'='*60}")
-print(f"Test completed in {result.duration_seconds:.1f}s")
-print("="*60)
+    bot_text = turn.bot_response.text if turn.bot_response else "(no response)"
+    lines.append(f"\n[Turn {i+1}]\n  User: {turn.user_input}\n  Bot: {bot_text}")
+lines.append(f"\n{'='*60}\nTest completed in {result.duration_seconds:.1f}s\n{'='*60}")
+sys.stdout.write("\n".join(lines) + "\n")
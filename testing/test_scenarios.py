@@ -5,6 +5,10 @@ This file contains test scenarios organized by category.
 Run with: python run_tests.py
 """
 
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+
 # === GREETING TESTS ===
 GREETING_TESTS = [
     {
@@ -317,44 +321,59 @@ SPECIAL_REQUESTS_TESTS = [
 
 
 # === COMBINE ALL TESTS ===
-def get_all_tests():
-    """Returns all test scenarios combined"""
-    return (
-        GREETING_TESTS +
-        BOOKING_FLOW_TESTS +
-        DATE_TIME_TESTS +
-        MODIFICATION_TESTS +
-        CANCELLATION_TESTS +
-        EDGE_CASE_TESTS +
-        MULTI_TURN_TESTS +
-        SPECIAL_REQUESTS_TESTS
+def _freeze(tests):
+    """
+    Immutable view of a category: scenarios become tuples of read-only
+    turn mappings, so the catalog can be shared across threads and reused
+    between runs without risk of accidental mutation.
+    """
+    return tuple(
+        {**t, "turns": tuple(MappingProxyType(turn) for turn in t["turns"])}
+        for t in tests
     )
 
 
+GREETING_TESTS = _freeze(GREETING_TESTS)
+BOOKING_FLOW_TESTS = _freeze(BOOKING_FLOW_TESTS)
+DATE_TIME_TESTS = _freeze(DATE_TIME_TESTS)
+MODIFICATION_TESTS = _freeze(MODIFICATION_TESTS)
+CANCELLATION_TESTS = _freeze(CANCELLATION_TESTS)
+EDGE_CASE_TESTS = _freeze(EDGE_CASE_TESTS)
+MULTI_TURN_TESTS = _freeze(MULTI_TURN_TESTS)
+SPECIAL_REQUESTS_TESTS = _freeze(SPECIAL_REQUESTS_TESTS)
+
+# Category index built once at import; get_tests_by_category rebuilt this
+# dict on every call.
+_CATEGORIES = {
+    "greeting": GREETING_TESTS,
+    "booking": BOOKING_FLOW_TESTS,
+    "datetime": DATE_TIME_TESTS,
+    "modification": MODIFICATION_TESTS,
+    "cancellation": CANCELLATION_TESTS,
+    "edge": EDGE_CASE_TESTS,
+    "multiturn": MULTI_TURN_TESTS,
+    "special": SPECIAL_REQUESTS_TESTS,
+}
+
+
+def iter_all_tests():
+    """Iterate over all test scenarios without materializing a list"""
+    return chain.from_iterable(_CATEGORIES.values())
+
+
+@lru_cache(maxsize=1)
+def get_all_tests():
+    """Returns all test scenarios combined (built once, then memoized)"""
+    # chain builds the combined tuple in one pass instead of allocating an
+    # intermediate list per + between the eight categories
+    return tuple(iter_all_tests())
+
+
 def get_tests_by_category(category: str):
     """Get tests by category name"""
-    categories = {
-        "greeting": GREETING_TESTS,
-        "booking": BOOKING_FLOW_TESTS,
-        "datetime": DATE_TIME_TESTS,
-        "modification": MODIFICATION_TESTS,
-        "cancellation": CANCELLATION_TESTS,
-        "edge": EDGE_CASE_TESTS,
-        "multiturn": MULTI_TURN_TESTS,
-        "special": SPECIAL_REQUESTS_TESTS
-    }
-    return categories.get(category.lower(), [])
+    return _CATEGORIES.get(category.lower(), [])
 
 
 def list_categories():
     """List all available test categories"""
-    return [
-        "greeting",
-        "booking",
-        "datetime",
-        "modification",
-        "cancellation",
-        "edge",
-        "multiturn",
-        "special"
-    ]
+    return list(_CATEGORIES)
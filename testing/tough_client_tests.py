@@ -13,24 +13,64 @@ Each test includes explicit time selection to handle availability conflicts.
 """
 
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+
+import requests
+
 from conversation_tester import ConversationTester, TestConfig, run_test_suite
 
 
+def _preflight(config: TestConfig) -> None:
+    """
+    Ping both servers' health endpoints in parallel with a short timeout,
+    so a missing server fails the run in about a second instead of
+    surfacing as the first scenario's connection error.
+    """
+    urls = (
+        config.bot_webhook_url.replace("/whatsapp-webhook", "/health"),
+        f"{config.mock_server_url}/health",
+    )
+
+    def _ping(url: str) -> None:
+        requests.get(url, timeout=1).raise_for_status()
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = [executor.submit(_ping, url) for url in urls]
+        for url, future in zip(urls, futures):
+            try:
+                future.result()
+            except Exception as e:
+                raise ConnectionError(f"Preflight check failed for {url}: {e}")
+
+
+def _freeze(test: dict) -> dict:
+    """
+    Read-only view of a scenario (turns become a tuple of read-only
+    mappings), safe to share between the concurrently running testers.
+    """
+    return {**test, "turns": tuple(MappingProxyType(t) for t in test["turns"])}
+
+
+@lru_cache(maxsize=2)
+def _date_str(ordinal: int) -> str:
+    """dd/mm/yyyy for a proleptic ordinal; f-string formatting skips the
+    libc locale machinery strftime drags in for a fixed ASCII pattern."""
+    d = date.fromordinal(ordinal)
+    return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
+
+
 def get_next_saturday() -> str:
     """Get the next Saturday date in dd/mm/yyyy format."""
-    today = datetime.now()
-    days_until_saturday = (5 - today.weekday()) % 7
-    if days_until_saturday == 0:
-        days_until_saturday = 7
-    next_sat = today + timedelta(days=days_until_saturday)
-    return next_sat.strftime("%d/%m/%Y")
+    today = date.today()
+    return _date_str(today.toordinal() + ((5 - today.weekday()) % 7 or 7))
 
 
 def get_tomorrow() -> str:
     """Get tomorrow's date."""
-    tomorrow = datetime.now() + timedelta(days=1)
-    return tomorrow.strftime("%d/%m/%Y")
+    return _date_str(date.today().toordinal() + 1)
 
 
 # Get dynamic dates
@@ -39,7 +79,7 @@ TOMORROW = get_tomorrow()
 
 
 # Test 1: Non-Existing Rice Types (Persistent Client)
-TEST_1_INVALID_RICES = {
+TEST_1_INVALID_RICES = _freeze({
     "name": "Test 1: Non-Existing Rice Types (Persistent Client)",
     "phone": "34611111111",
     "turns": [
@@ -79,12 +119,12 @@ TEST_1_INVALID_RICES = {
             "expected_not_contains": ["error"]
         }
     ]
-}
+})
 
 
 # Test 2: Insisting on More Than 10 People
 # If Saturday is full, accept Thursday alternative
-TEST_2_LARGE_GROUP = {
+TEST_2_LARGE_GROUP = _freeze({
     "name": "Test 2: Insisting on More Than 10 People",
     "phone": "34622222222",
     "turns": [
@@ -114,12 +154,12 @@ TEST_2_LARGE_GROUP = {
             "expected_not_contains": ["error"]
         }
     ]
-}
+})
 
 
 # Test 3: Two Rice Types Request (Only 1 Allowed)
 # Use Sunday since Saturday gets filled by other tests
-TEST_3_TWO_RICE_TYPES = {
+TEST_3_TWO_RICE_TYPES = _freeze({
     "name": "Test 3: Two Rice Types Request (Only 1 Allowed)",
     "phone": "34633333333",
     "turns": [
@@ -154,11 +194,11 @@ TEST_3_TWO_RICE_TYPES = {
             "expected_not_contains": ["error"]
         }
     ]
-}
+})
 
 
 # Test 4: Simple Successful Booking (Baseline)
-TEST_4_SIMPLE_SUCCESS = {
+TEST_4_SIMPLE_SUCCESS = _freeze({
     "name": "Test 4: Simple Successful Booking",
     "phone": "34644444444",
     "turns": [
@@ -183,12 +223,12 @@ TEST_4_SIMPLE_SUCCESS = {
             "expected_not_contains": ["error"]
         }
     ]
-}
+})
 
 
 # Test 5: Combination Chaos (Multiple Issues)
 # Uses Sunday 15:00 to avoid conflicts with other tests
-TEST_5_COMBINATION_CHAOS = {
+TEST_5_COMBINATION_CHAOS = _freeze({
     "name": "Test 5: Combination Chaos (Multiple Issues)",
     "phone": "34655555555",
     "turns": [
@@ -223,7 +263,7 @@ TEST_5_COMBINATION_CHAOS = {
             "expected_not_contains": ["error"]
         }
     ]
-}
+})
 
 
 def run_single_test(test_scenario: dict, config: TestConfig) -> dict:
@@ -259,8 +299,7 @@ def main():
     config = TestConfig(
         bot_webhook_url="http://localhost:5082/api/webhook/whatsapp-webhook",
         mock_server_url="http://localhost:8080",
-        response_timeout=60,  # Longer timeout for LLM responses
-        poll_interval=0.5
+        response_timeout=60  # Longer timeout for LLM responses
     )
 
     all_tests = [
@@ -281,7 +320,12 @@ def main():
             print(f"Invalid test number: {test_num}. Running all tests.")
 
     try:
-        summary = run_test_suite(all_tests, config)
+        _preflight(config)
+
+        # Each scenario has its own phone, so there is no state coupling
+        # between them: run them concurrently and let the per-turn LLM
+        # waits overlap instead of paying them back to back.
+        summary = run_test_suite(all_tests, config, max_workers=len(all_tests))
 
         print("\n" + "=" * 70)
         print("FINAL SUMMARY")
@@ -1,10 +1,44 @@
 from __future__ import annotations
 
+import re
+
 import requests
+from requests.adapters import HTTPAdapter
+
+# Marker strings the bot stamps on its two notable outgoing messages,
+# defined once so every assertion matches the exact same bytes.
+_CONFIRM_PREFIX = "*Confirmación de Reserva"
+_ADMIN_MARKER = "Nueva reserva insertada por el Asistente IA"
+
+# Combined pattern for the negative assertion: one compiled scan per
+# message answers "does this contain either marker" instead of a
+# startswith plus a substring search.
+_FORBIDDEN_RE = re.compile(
+    f"^{re.escape(_CONFIRM_PREFIX)}|{re.escape(_ADMIN_MARKER)}"
+)
 
+# One keep-alive session for every fetch in this module: without it each
+# assertion call pays a fresh TCP handshake to the mock server.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
 
-def fetch_captured(mock_url: str) -> list[dict]:
-    resp = requests.get(f"{mock_url}/captured", timeout=10)
+
+def fetch_captured(
+    mock_url: str,
+    phone: str | None = None,
+    msg_type: str | None = None,
+) -> list[dict]:
+    """
+    Fetch captured messages, optionally narrowed server-side. The mock
+    indexes captures by phone and by type, so passing these here returns
+    just the relevant slice instead of the full list for client filtering.
+    """
+    params = {}
+    if phone is not None:
+        params["phone"] = phone
+    if msg_type is not None:
+        params["type"] = msg_type
+    resp = _SESSION.get(f"{mock_url}/captured", params=params or None, timeout=10)
     resp.raise_for_status()
     return resp.json().get("messages", [])
 
@@ -17,7 +51,7 @@ def assert_customer_confirmation_sent(messages: list[dict], phone: str) -> None:
     phone_msgs = filter_by_phone(messages, phone)
     # Confirmation is sent as a menu_button (link buttons) and starts with a known header.
     for m in phone_msgs:
-        if m.get("type") == "menu_button" and (m.get("text") or "").startswith("*Confirmación de Reserva"):
+        if m.get("type") == "menu_button" and (m.get("text") or "").startswith(_CONFIRM_PREFIX):
             return
     raise AssertionError(f"Expected customer confirmation (menu_button) to be sent to {phone}, but did not find it.")
 
@@ -26,18 +60,57 @@ def assert_admin_notification_sent(messages: list[dict]) -> None:
     # Admin notification is plain text containing this header.
     for m in messages:
         txt = m.get("text") or ""
-        if "Nueva reserva insertada por el Asistente IA" in txt:
+        if _ADMIN_MARKER in txt:
             return
     raise AssertionError("Expected admin notification text to be sent, but did not find it in captured messages.")
 
 
+def assert_turn_outcome(
+    messages: list[dict],
+    phone: str,
+    *,
+    want_confirmation: bool,
+    want_admin: bool,
+) -> None:
+    """
+    Check confirmation and admin-notification outcomes in one pass over a
+    pre-fetched message list, so a turn needs a single /captured fetch
+    instead of one per assertion.
+    """
+    confirmation_seen = False
+    admin_seen = False
+    for m in messages:
+        txt = m.get("text") or ""
+        if (
+            not confirmation_seen
+            and m.get("phone") == phone
+            and m.get("type") == "menu_button"
+            and txt.startswith(_CONFIRM_PREFIX)
+        ):
+            confirmation_seen = True
+        if not admin_seen and _ADMIN_MARKER in txt:
+            admin_seen = True
+        if confirmation_seen and admin_seen:
+            break
+
+    if want_confirmation and not confirmation_seen:
+        raise AssertionError(f"Expected customer confirmation (menu_button) to be sent to {phone}, but did not find it.")
+    if not want_confirmation and confirmation_seen:
+        raise AssertionError(f"Did not expect customer confirmation to be sent to {phone}, but it was captured.")
+    if want_admin and not admin_seen:
+        raise AssertionError("Expected admin notification text to be sent, but did not find it in captured messages.")
+    if not want_admin and admin_seen:
+        raise AssertionError("Did not expect admin notification, but it was captured.")
+
+
 def assert_no_confirmation_or_admin(messages: list[dict], phone: str) -> None:
-    phone_msgs = filter_by_phone(messages, phone)
-    for m in phone_msgs:
+    for m in filter_by_phone(messages, phone):
         txt = m.get("text") or ""
-        if txt.startswith("*Confirmación de Reserva"):
+        hit = _FORBIDDEN_RE.search(txt)
+        if hit is None:
+            continue
+        if hit.start() == 0 and txt.startswith(_CONFIRM_PREFIX):
             raise AssertionError(f"Did not expect customer confirmation to be sent to {phone}, but it was captured.")
-        if "Nueva reserva insertada por el Asistente IA" in txt:
-            raise AssertionError("Did not expect admin notification, but it was captured.")
+        raise AssertionError("Did not expect admin notification, but it was captured.")
 
 